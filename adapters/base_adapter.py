@@ -7,10 +7,30 @@ Provides common functionality for all EventKit adapters (Foundry, Power Platform
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Callable
 from enum import Enum
+import asyncio
+import atexit
+import collections
+import functools
 import logging
+import time
+import weakref
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 import json
 
+# orjson parses and serializes significantly faster than stdlib json
+# (optional); dumps always returns bytes so either backend is drop-in
+try:
+    import orjson
+    _json_loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 from core import recommend, explain, export_itinerary
 from settings import Settings
 from errors import InvalidInputError, EventKitError
@@ -21,6 +41,133 @@ try:
 except ImportError:
     TelemetryClient = None
 
+# fastjsonschema compiles a schema into specialized Python code (optional)
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+
+def _compile_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build a parameter validator for a tool schema, once per registration.
+
+    Uses fastjsonschema when installed; otherwise falls back to a prebuilt
+    required-keys check so validation stays loop-free per call.
+    """
+    if HAS_FASTJSONSCHEMA:
+        return fastjsonschema.compile(dict(schema))
+
+    required = tuple(schema.get("required", ()))
+
+    def _check(parameters: Dict[str, Any]) -> Dict[str, Any]:
+        for name in required:
+            if name not in parameters:
+                raise InvalidInputError(f"Missing required parameter: {name}")
+        return parameters
+
+    return _check
+
+
+@functools.lru_cache(maxsize=8)
+def _load_manifest_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a manifest file, cached per (path, mtime, size) version.
+
+    Multiple adapter instances (Foundry/Power/Bot) share the same agent.json;
+    keying on the stat signature means the JSON parse happens once per file
+    version instead of once per adapter construction.
+    """
+    return _json_loads(Path(path_str).read_bytes())
+
+
+def _invalidate_manifest_cache() -> None:
+    """Drop cached manifest parses (for tests and manual reloads)."""
+    _load_manifest_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_interests(raw: str) -> tuple:
+    """Split a comma-separated interests string, one strip per token.
+
+    Cached by raw string since repeat users send identical interests, turning
+    the split into a dict lookup on the hot path. Returns a tuple so the
+    cached value can't be mutated through a caller's reference; callers
+    needing a list copy it with list(...).
+    """
+    return tuple(t for t in (x.strip() for x in raw.split(",")) if t)
+
+
+# Telemetry batching: flush after this many buffered events, or on the
+# first event that arrives once the buffer is this many seconds old. The
+# interval check piggybacks on event arrival — a quiet adapter holds its
+# buffer until the next event or the atexit drain below.
+_TELEMETRY_BATCH_SIZE = 32
+_TELEMETRY_FLUSH_INTERVAL = 5.0
+
+# Live adapters with possibly-buffered telemetry. Weak references so the
+# exit hook never keeps a discarded adapter alive; one module-level hook
+# replaces the old per-instance atexit.register, which pinned every
+# adapter ever constructed for the life of the process.
+_LIVE_ADAPTERS: "weakref.WeakSet" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_telemetry() -> None:
+    for adapter in list(_LIVE_ADAPTERS):
+        adapter._flush_telemetry()
+
+# Tool schemas are shared read-only across all adapters in the process
+_RECOMMEND_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "interests": {
+            "type": "string",
+            "description": "Comma-separated list of interests"
+        },
+        "top": {
+            "type": "integer",
+            "description": "Number of sessions to return",
+            "default": 5
+        },
+        "use_graph": {
+            "type": "boolean",
+            "description": "Use Microsoft Graph for personalization",
+            "default": False
+        }
+    },
+    "required": ["interests"]
+})
+
+_EXPLAIN_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "session_title": {
+            "type": "string",
+            "description": "Title of the session to explain"
+        },
+        "interests": {
+            "type": "string",
+            "description": "User's interests"
+        }
+    },
+    "required": ["session_title", "interests"]
+})
+
+_EXPORT_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "interests": {
+            "type": "string",
+            "description": "User's interests"
+        },
+        "profile_name": {
+            "type": "string",
+            "description": "Profile name for the itinerary"
+        }
+    },
+    "required": ["interests"]
+})
+
 
 class AdapterType(Enum):
     """Types of adapters."""
@@ -33,6 +180,17 @@ class AdapterType(Enum):
 class ToolDefinition:
     """Metadata for an EventKit tool."""
 
+    __slots__ = (
+        "name",
+        "description",
+        "handler",
+        "parameters",
+        "required_params",
+        "defaults",
+        "response_format",
+        "validate",
+    )
+
     def __init__(
         self,
         name: str,
@@ -44,8 +202,19 @@ class ToolDefinition:
         self.name = name
         self.description = description
         self.handler = handler
-        self.parameters = parameters
+        # Freeze the schema so adapters can share one instance safely
+        if isinstance(parameters, MappingProxyType):
+            self.parameters = parameters
+        else:
+            self.parameters = MappingProxyType(parameters)
+        self.required_params = frozenset(self.parameters.get("required", ()))
+        self.defaults = {
+            name: schema["default"]
+            for name, schema in self.parameters.get("properties", {}).items()
+            if "default" in schema
+        }
         self.response_format = response_format or "json"
+        self.validate = _compile_validator(self.parameters)
 
 
 class UnifiedAdapter(ABC):
@@ -60,6 +229,23 @@ class UnifiedAdapter(ABC):
     - Request/response transformation
     """
 
+    __slots__ = (
+        "adapter_type",
+        "_adapter_type_str",
+        "settings",
+        "telemetry",
+        "manifest_path",
+        "_manifest",
+        "_telemetry_buffer",
+        "_telemetry_last_flush",
+        "tools",
+        "_tool_defs_cache",
+        "_last_tool_name",
+        "_last_tool",
+        "logger",
+        "__weakref__",  # required for the _LIVE_ADAPTERS WeakSet
+    )
+
     def __init__(
         self,
         adapter_type: AdapterType,
@@ -77,28 +263,52 @@ class UnifiedAdapter(ABC):
             manifest_path: Path to agent manifest
         """
         self.adapter_type = adapter_type
+        # Enum attribute access goes through the descriptor protocol; cache
+        # the value string once for the hot logging/telemetry paths
+        self._adapter_type_str = adapter_type.value
         self.settings = settings or Settings()
         self.telemetry = telemetry or (TelemetryClient() if TelemetryClient else None)
         self.manifest_path = manifest_path
+        self._manifest: Optional[Dict[str, Any]] = None
 
-        # Load manifest
-        self.manifest = self._load_manifest()
+        # Buffer telemetry so each tool call doesn't pay a serialization +
+        # I/O round trip; flushed by size, age, error paths, and at exit
+        # (via the module-level drain, which holds only a weak reference).
+        self._telemetry_buffer: collections.deque = collections.deque(maxlen=512)
+        self._telemetry_last_flush = time.monotonic()
+        _LIVE_ADAPTERS.add(self)
 
         # Register tools
         self.tools: Dict[str, ToolDefinition] = {}
+        self._tool_defs_cache: Optional[List[Dict[str, Any]]] = None
+        # Single-entry memo for the common run of repeated tool names
+        self._last_tool_name: Optional[str] = None
+        self._last_tool: Optional[ToolDefinition] = None
         self._register_tools()
 
-        self.logger = logging.getLogger(f"{__name__}.{adapter_type.value}")
-        self.logger.info(f"Initialized {adapter_type.value} adapter with {len(self.tools)} tools")
+        self.logger = logging.getLogger(f"{__name__}.{self._adapter_type_str}")
+        self.logger.info(f"Initialized {self._adapter_type_str} adapter with {len(self.tools)} tools")
 
-    def _load_manifest(self) -> Dict[str, Any]:
-        """Load agent.json manifest."""
-        from pathlib import Path
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """Agent manifest, loaded lazily on first access.
+
+        Tool listing and health checks never touch the manifest, so the
+        JSON read is deferred until a _handle_* method needs it.
+        (Slot-backed rather than cached_property, which needs a __dict__.)
+        """
+        if self._manifest is None:
+            self._manifest = self._load_manifest()
+        return self._manifest
 
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load agent.json manifest (parsed once per file version)."""
         manifest_file = Path(self.manifest_path)
         if manifest_file.exists():
-            with open(manifest_file) as f:
-                return json.load(f)
+            st = manifest_file.stat()
+            return _load_manifest_cached(
+                str(manifest_file.resolve()), st.st_mtime_ns, st.st_size
+            )
 
         self.logger.warning(f"Manifest not found: {self.manifest_path}")
         return {"sessions": []}
@@ -110,26 +320,7 @@ class UnifiedAdapter(ABC):
             name="recommend_sessions",
             description="Recommend conference sessions based on user interests",
             handler=self._handle_recommend,
-            parameters={
-                "type": "object",
-                "properties": {
-                    "interests": {
-                        "type": "string",
-                        "description": "Comma-separated list of interests"
-                    },
-                    "top": {
-                        "type": "integer",
-                        "description": "Number of sessions to return",
-                        "default": 5
-                    },
-                    "use_graph": {
-                        "type": "boolean",
-                        "description": "Use Microsoft Graph for personalization",
-                        "default": False
-                    }
-                },
-                "required": ["interests"]
-            }
+            parameters=_RECOMMEND_SCHEMA
         )
 
         # Explain session tool
@@ -137,20 +328,7 @@ class UnifiedAdapter(ABC):
             name="explain_session",
             description="Explain why a session matches user interests",
             handler=self._handle_explain,
-            parameters={
-                "type": "object",
-                "properties": {
-                    "session_title": {
-                        "type": "string",
-                        "description": "Title of the session to explain"
-                    },
-                    "interests": {
-                        "type": "string",
-                        "description": "User's interests"
-                    }
-                },
-                "required": ["session_title", "interests"]
-            }
+            parameters=_EXPLAIN_SCHEMA
         )
 
         # Export itinerary tool
@@ -158,35 +336,25 @@ class UnifiedAdapter(ABC):
             name="export_itinerary",
             description="Export personalized itinerary to markdown",
             handler=self._handle_export,
-            parameters={
-                "type": "object",
-                "properties": {
-                    "interests": {
-                        "type": "string",
-                        "description": "User's interests"
-                    },
-                    "profile_name": {
-                        "type": "string",
-                        "description": "Profile name for the itinerary"
-                    }
-                },
-                "required": ["interests"]
-            }
+            parameters=_EXPORT_SCHEMA
         )
 
     def handle_tool_call(
         self,
         tool_name: str,
         parameters: Dict[str, Any],
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        correlation_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Handle tool call with unified error handling and telemetry.
 
         Args:
             tool_name: Name of the tool to invoke
-            parameters: Tool parameters
+            parameters: Tool parameters (treated as read-only)
             context: Optional adapter-specific context
+            correlation_id: Optional request-tracing ID; falls back to
+                context, then to a legacy "correlation_id" parameter
 
         Returns:
             Tool execution result
@@ -195,27 +363,38 @@ class UnifiedAdapter(ABC):
             InvalidInputError: If tool is unknown or parameters are invalid
             EventKitError: If tool execution fails
         """
-        start_time = datetime.utcnow()
-        correlation_id = parameters.pop("correlation_id", None)
-
-        self.logger.info(
-            f"Tool call: {tool_name}",
-            extra={
-                "tool": tool_name,
-                "adapter": self.adapter_type.value,
-                "correlation_id": correlation_id
-            }
-        )
-
-        # Get tool definition
-        tool = self.tools.get(tool_name)
+        start_ns = time.perf_counter_ns()
+        if correlation_id is None:
+            correlation_id = (context or {}).get("correlation_id") or parameters.get(
+                "correlation_id"
+            )
+
+        # Gate on level so suppressed log lines skip the extra-dict build
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Tool call: %s",
+                tool_name,
+                extra={
+                    "tool": tool_name,
+                    "adapter": self._adapter_type_str,
+                    "correlation_id": correlation_id
+                }
+            )
+
+        # Get tool definition (pointer compare beats a dict hash for the
+        # common case of long runs of the same tool)
+        if tool_name == self._last_tool_name:
+            tool = self._last_tool
+        else:
+            tool = self.tools.get(tool_name)
+            self._last_tool_name, self._last_tool = tool_name, tool
         if not tool:
             error_msg = f"Unknown tool: {tool_name}"
             self.logger.error(error_msg)
             self._log_telemetry("tool_call_failed", {
                 "tool": tool_name,
                 "error": "unknown_tool",
-                "duration_ms": (datetime.utcnow() - start_time).total_seconds() * 1000
+                "duration_ms": (time.perf_counter_ns() - start_ns) / 1_000_000
             })
             raise InvalidInputError(error_msg)
 
@@ -230,10 +409,10 @@ class UnifiedAdapter(ABC):
             response = self._transform_response(tool, result, context)
 
             # Log success telemetry
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             self._log_telemetry("tool_call_success", {
                 "tool": tool_name,
-                "adapter": self.adapter_type.value,
+                "adapter": self._adapter_type_str,
                 "duration_ms": duration_ms,
                 "correlation_id": correlation_id
             })
@@ -241,7 +420,7 @@ class UnifiedAdapter(ABC):
             return response
 
         except InvalidInputError as e:
-            self.logger.error(f"Invalid parameters: {e}")
+            self.logger.error("Invalid parameters: %s", e)
             self._log_telemetry("tool_call_failed", {
                 "tool": tool_name,
                 "error": "invalid_parameters",
@@ -249,7 +428,7 @@ class UnifiedAdapter(ABC):
             })
             raise
         except Exception as e:
-            self.logger.exception(f"Tool execution failed: {e}")
+            self.logger.exception("Tool execution failed: %s", e)
             self._log_telemetry("tool_call_failed", {
                 "tool": tool_name,
                 "error": "execution_error",
@@ -257,14 +436,29 @@ class UnifiedAdapter(ABC):
             })
             raise EventKitError(f"Tool execution failed: {e}") from e
 
+    async def handle_tool_call_async(
+        self,
+        tool_name: str,
+        parameters: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async entry point for handle_tool_call.
+
+        Runs the sync body in a worker thread so blocking handlers don't
+        stall the caller's event loop.
+        """
+        return await asyncio.to_thread(
+            self.handle_tool_call, tool_name, parameters, context, correlation_id
+        )
+
     def _handle_recommend(
         self,
         parameters: Dict[str, Any],
         context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Handle recommend_sessions tool call."""
-        interests = parameters.get("interests", "").split(",")
-        interests = [i.strip() for i in interests if i.strip()]
+        interests = list(_parse_interests(parameters.get("interests", "")))
         top = parameters.get("top", 5)
         use_graph = parameters.get("use_graph", False)
 
@@ -284,8 +478,7 @@ class UnifiedAdapter(ABC):
     ) -> Dict[str, Any]:
         """Handle explain_session tool call."""
         session_title = parameters.get("session_title", "")
-        interests = parameters.get("interests", "").split(",")
-        interests = [i.strip() for i in interests if i.strip()]
+        interests = list(_parse_interests(parameters.get("interests", "")))
 
         result = explain(self.manifest, session_title, interests)
 
@@ -301,8 +494,7 @@ class UnifiedAdapter(ABC):
         context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Handle export_itinerary tool call."""
-        interests = parameters.get("interests", "").split(",")
-        interests = [i.strip() for i in interests if i.strip()]
+        interests = list(_parse_interests(parameters.get("interests", "")))
         profile_name = parameters.get("profile_name", "default")
 
         result = export_itinerary(self.manifest, interests, profile_name)
@@ -314,12 +506,34 @@ class UnifiedAdapter(ABC):
         }
 
     def _log_telemetry(self, event: str, properties: Dict[str, Any]) -> None:
-        """Log telemetry event."""
-        if self.telemetry:
-            try:
-                self.telemetry.log_event(event, properties)
-            except Exception as e:
-                self.logger.warning(f"Failed to log telemetry: {e}")
+        """Buffer a telemetry event, flushing in batches."""
+        if not self.telemetry:
+            return
+        self._telemetry_buffer.append((event, properties))
+        now = time.monotonic()
+        if (
+            len(self._telemetry_buffer) >= _TELEMETRY_BATCH_SIZE
+            or now - self._telemetry_last_flush >= _TELEMETRY_FLUSH_INTERVAL
+            or event == "tool_call_failed"  # errors flush immediately for visibility
+        ):
+            self._flush_telemetry()
+
+    def _flush_telemetry(self) -> None:
+        """Dispatch buffered telemetry events to the client."""
+        if not self.telemetry or not self._telemetry_buffer:
+            return
+        events = list(self._telemetry_buffer)
+        self._telemetry_buffer.clear()
+        self._telemetry_last_flush = time.monotonic()
+        try:
+            log_batch = getattr(self.telemetry, "log_batch", None)
+            if log_batch is not None:
+                log_batch(events)
+            else:
+                for event, properties in events:
+                    self.telemetry.log_event(event, properties)
+        except Exception as e:
+            self.logger.warning(f"Failed to log telemetry: {e}")
 
     # Abstract methods (adapter-specific implementation)
 
@@ -361,18 +575,29 @@ class UnifiedAdapter(ABC):
         """
         pass
 
+    def register_tool(self, tool: ToolDefinition) -> None:
+        """Register an additional tool, invalidating the definitions cache."""
+        self.tools[tool.name] = tool
+        self._tool_defs_cache = None
+        self._last_tool_name = self._last_tool = None
+
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
         """
         Get tool definitions in adapter-specific format.
 
+        The registry is populated once in _register_tools, so the built list
+        is cached and reused across per-turn dispatch calls.
+
         Returns:
             List of tool definitions
         """
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": tool.parameters
-            }
-            for tool in self.tools.values()
-        ]
+        if self._tool_defs_cache is None:
+            self._tool_defs_cache = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters
+                }
+                for tool in self.tools.values()
+            ]
+        return self._tool_defs_cache
@@ -7,7 +7,8 @@ Unified adapter for:
 - Bot Framework channels
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+import functools
 import logging
 
 from adapters.base_adapter import UnifiedAdapter, AdapterType, ToolDefinition
@@ -16,11 +17,71 @@ try:
     from botbuilder.core import ActivityHandler, TurnContext
     from botbuilder.schema import Activity, ActivityTypes, Attachment
     HAS_BOT_FRAMEWORK = True
+    # Resolve the enum attribute once instead of per turn
+    _ACTIVITY_MSG = ActivityTypes.message
 except ImportError:
     HAS_BOT_FRAMEWORK = False
+    _ACTIVITY_MSG = None
     logging.info("Bot Framework SDK not installed. Install with: pip install botbuilder-core")
 
 
+# Static card header, hoisted so each render skips rebuilding it
+_HEADER_BLOCK = {
+    "type": "TextBlock",
+    "text": "Session Recommendations",
+    "weight": "Bolder",
+    "size": "Large"
+}
+
+
+def _build_container(title: str, score: float, topics: Tuple[str, ...]) -> Dict[str, Any]:
+    """Build the Adaptive Card container for a single session."""
+    return {
+        "type": "Container",
+        "items": [
+            {
+                "type": "TextBlock",
+                "text": title,
+                "weight": "Bolder",
+                "wrap": True
+            },
+            {
+                "type": "TextBlock",
+                "text": f"Topics: {', '.join(topics)}",
+                "wrap": True,
+                "isSubtle": True
+            },
+            {
+                "type": "TextBlock",
+                "text": f"Match Score: {int(score * 100)}%",
+                "color": "Good" if score > 0.7 else "Accent"
+            }
+        ],
+        "separator": True
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _build_card_cached(
+    key: Tuple[Tuple[str, float, Tuple[str, ...]], ...]
+) -> Dict[str, Any]:
+    """Build an Adaptive Card from a hashable session key.
+
+    Sequential turns over the same recommendation set ("show me again",
+    pagination) reuse the cached card instead of regenerating it.
+    """
+    body = [_HEADER_BLOCK] + [
+        _build_container(title, score, topics) for title, score, topics in key
+    ]
+
+    return {
+        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+        "type": "AdaptiveCard",
+        "version": "1.4",
+        "body": body
+    }
+
+
 class BotAdapter(UnifiedAdapter):
     """
     Bot Framework adapter for EventKit.
@@ -32,6 +93,8 @@ class BotAdapter(UnifiedAdapter):
     - All Bot Framework channels
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """Initialize Bot Framework adapter."""
         super().__init__(AdapterType.BOT_FRAMEWORK, **kwargs)
@@ -58,11 +121,8 @@ class BotAdapter(UnifiedAdapter):
                 "use_graph": parameters.get("use_graph", False)
             }
 
-        # Standard parameter validation
-        required = tool.parameters.get("required", [])
-        for param_name in required:
-            if param_name not in parameters:
-                raise ValueError(f"Missing required parameter: {param_name}")
+        # Standard parameter validation (validator precompiled at registration)
+        tool.validate(parameters)
 
         return parameters
 
@@ -77,14 +137,15 @@ class BotAdapter(UnifiedAdapter):
         result_data = result.get("result", {})
         sessions = result_data.get("sessions", [])
 
-        # Generate text summary
+        # Generate text summary (join once instead of += reallocation)
         if sessions:
-            summary = f"Found {len(sessions)} sessions:\n\n"
+            parts = [f"Found {len(sessions)} sessions:", ""]
             for i, session in enumerate(sessions[:3], 1):
-                summary += f"{i}. **{session.get('title', 'Unknown')}**\n"
-                topics = session.get('topics', [])
+                parts.append(f"{i}. **{session.get('title', 'Unknown')}**")
+                topics = session.get('topics')
                 if topics:
-                    summary += f"   Topics: {', '.join(topics)}\n"
+                    parts.append(f"   Topics: {', '.join(topics)}")
+            summary = "\n".join(parts)
         else:
             summary = "No sessions found for your interests."
 
@@ -105,47 +166,16 @@ class BotAdapter(UnifiedAdapter):
         return response
 
     def _generate_adaptive_card(self, sessions: list) -> Dict[str, Any]:
-        """Generate Adaptive Card for sessions."""
-        body = [
-            {
-                "type": "TextBlock",
-                "text": "Session Recommendations",
-                "weight": "Bolder",
-                "size": "Large"
-            }
-        ]
-
-        for session in sessions[:5]:
-            body.append({
-                "type": "Container",
-                "items": [
-                    {
-                        "type": "TextBlock",
-                        "text": session.get("title", ""),
-                        "weight": "Bolder",
-                        "wrap": True
-                    },
-                    {
-                        "type": "TextBlock",
-                        "text": f"Topics: {', '.join(session.get('topics', []))}",
-                        "wrap": True,
-                        "isSubtle": True
-                    },
-                    {
-                        "type": "TextBlock",
-                        "text": f"Match Score: {int(session.get('score', 0) * 100)}%",
-                        "color": "Good" if session.get('score', 0) > 0.7 else "Accent"
-                    }
-                ],
-                "separator": True
-            })
-
-        return {
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-            "type": "AdaptiveCard",
-            "version": "1.4",
-            "body": body
-        }
+        """Generate Adaptive Card for sessions (cached by session key)."""
+        key = tuple(
+            (
+                s.get("title", ""),
+                round(s.get("score", 0), 3),
+                tuple(s.get("topics", ())),
+            )
+            for s in sessions[:5]
+        )
+        return _build_card_cached(key)
 
     async def handle_activity(
         self,
@@ -160,23 +190,32 @@ class BotAdapter(UnifiedAdapter):
         if not HAS_BOT_FRAMEWORK:
             raise RuntimeError("Bot Framework SDK not installed")
 
-        if turn_context.activity.type == ActivityTypes.message:
-            text = turn_context.activity.text or ""
+        activity = turn_context.activity
+        if activity.type != _ACTIVITY_MSG:
+            return
 
-            # Call unified tool handler
-            result = self.handle_tool_call(
-                "recommend_sessions",
-                {"text": text, "top": 5},
-                {"include_card": True}
-            )
+        text = activity.text or ""
 
-            # Send response
-            await turn_context.send_activity(
-                Activity(
-                    type=result["type"],
-                    text=result["text"],
-                    attachments=[
-                        Attachment(**attach) for attach in result.get("attachments", [])
-                    ]
+        # Call unified tool handler
+        result = self.handle_tool_call(
+            "recommend_sessions",
+            {"text": text, "top": 5},
+            {
+                "include_card": True,
+                "correlation_id": getattr(activity, "id", None),
+            }
+        )
+
+        # Send response (skip building Attachment objects when empty)
+        attachments_in = result.get("attachments")
+        await turn_context.send_activity(
+            Activity(
+                type=result["type"],
+                text=result["text"],
+                attachments=(
+                    [Attachment(**attach) for attach in attachments_in]
+                    if attachments_in
+                    else None
                 )
             )
+        )
@@ -13,11 +13,27 @@ Bot Framework adapter with Adaptive Card support.
 from __future__ import annotations
 
 import argparse
-import asyncio
+import json
 import os
 from typing import Any, Dict, List, Optional
 
+# orjson parses significantly faster than stdlib json (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# pysimdjson parses on demand, materializing only the fields accessed (optional)
+try:
+    import simdjson
+    _PARSER = simdjson.Parser()
+except ImportError:
+    _PARSER = None
+
+
 import aiohttp
+import yarl
 from aiohttp import web
 from botbuilder.core import (
     ActivityHandler,
@@ -39,6 +55,39 @@ except ImportError:
     HAS_UNIFIED_ADAPTER = False
 
 
+def _extract_payload(raw: bytes) -> tuple[Optional[Dict[str, Any]], List[str]]:
+    """Pull only the adaptive card and the first three titles from a payload.
+
+    The recommendation response can carry dozens of sessions with abstracts;
+    only the card and a few titles are rendered, so the lazy parser skips
+    decoding the rest when available.
+    """
+    if _PARSER is not None:
+        doc = _PARSER.parse(raw)
+        titles: List[str] = []
+        try:
+            for s in doc["sessions"]:
+                titles.append(s["title"])
+                if len(titles) == 3:
+                    break
+        except (KeyError, TypeError):
+            pass
+        try:
+            card_obj = doc["adaptiveCard"]
+            card = card_obj.as_dict() if hasattr(card_obj, "as_dict") else card_obj
+        except (KeyError, TypeError):
+            # TypeError matches the stdlib branch: a non-dict payload
+            # (e.g. a top-level array) yields no card rather than raising
+            card = None
+        return card, titles
+
+    data = _json_loads(raw)
+    if not isinstance(data, dict):
+        return None, []
+    titles = [s.get("title", "") for s in data.get("sessions", [])[:3]]
+    return data.get("adaptiveCard"), titles
+
+
 class AgentBridgeBot(ActivityHandler):
     """
     Bot Framework bridge for EventKit.
@@ -49,6 +98,8 @@ class AgentBridgeBot(ActivityHandler):
     def __init__(self, agent_base: str) -> None:
         super().__init__()
         self.agent_base = agent_base.rstrip("/")
+        self._recommend_base = yarl.URL(self.agent_base) / "recommend"
+        self._session: Optional[aiohttp.ClientSession] = None
 
         # Try to use unified adapter
         if HAS_UNIFIED_ADAPTER:
@@ -95,24 +146,34 @@ class AgentBridgeBot(ActivityHandler):
         else:
             await turn_context.send_activity(summary or "No results")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create a bot-lifetime session so connections are pooled."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
     async def _fetch_recommendations(
         self, interests: str
     ) -> tuple[Optional[Dict[str, Any]], str]:
         """Fetch recommendations from HTTP API (fallback)."""
-        url = f"{self.agent_base}/recommend?interests={aiohttp.helpers.quote(interests)}&top=3&card=1"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    return None, f"Error from agent API: HTTP {resp.status}"
-                data = await resp.json()
-        sessions: List[Dict[str, Any]] = (
-            data.get("sessions", []) if isinstance(data, dict) else []
-        )
-        card = data.get("adaptiveCard") if isinstance(data, dict) else None
-        if not sessions:
+        # yarl percent-encodes in C and aiohttp skips re-encoding URL objects
+        url = self._recommend_base.with_query(interests=interests, top=3, card=1)
+        session = await self._get_session()
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                return None, f"Error from agent API: HTTP {resp.status}"
+            raw = await resp.read()
+        card, titles = _extract_payload(raw)
+        if not titles:
             return card, "No sessions found for your interests."
-        titles = ", ".join(s.get("title", "") for s in sessions[:3])
-        return card, f"Top sessions: {titles}"
+        return card, f"Top sessions: {', '.join(titles)}"
 
 
 async def init_app(
@@ -136,7 +197,11 @@ async def init_app(
         except Exception as exc:  # pragma: no cover - telemetry would normally capture
             return web.Response(status=500, text=str(exc))
 
+    async def cleanup(app: web.Application) -> None:
+        await bot.close()
+
     app.router.add_post("/api/messages", messages)
+    app.on_cleanup.append(cleanup)
     return app
 
 
@@ -161,9 +226,9 @@ def main() -> None:
     adapter = BotFrameworkAdapter(settings)
     bot = AgentBridgeBot(args.agent_api_base)
 
-    loop = asyncio.get_event_loop()
-    app = loop.run_until_complete(init_app(adapter, bot))
-    web.run_app(app, host="0.0.0.0", port=args.port)
+    # run_app accepts the coroutine and awaits it on its own loop, avoiding
+    # the deprecated get_event_loop()/run_until_complete double setup
+    web.run_app(init_app(adapter, bot), host="0.0.0.0", port=args.port)
 
 
 if __name__ == "__main__":
@@ -7,20 +7,117 @@ Unified adapter for:
 - Prompt Flow integration
 """
 
-from typing import Any, Dict, Optional
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+import asyncio
+import functools
 import logging
+import threading
+import time
 
 from adapters.base_adapter import UnifiedAdapter, AdapterType, ToolDefinition
 from settings import Settings
 
-try:
+if TYPE_CHECKING:
+    # Type-only imports; the runtime path goes through the lazy importer
     from agent_framework_azure_ai import AzureAIAgent
-    from agent_framework import Agent, Tool, RunContext
-    from azure.identity import DefaultAzureCredential
-    HAS_AGENT_FRAMEWORK = True
-except ImportError:
-    HAS_AGENT_FRAMEWORK = False
-    logging.info("Microsoft Agent Framework not available. Install with: pip install agent-framework-azure-ai --pre")
+    from azure.core.credentials import AccessToken
+
+# Lazily imported: the agent_framework / azure.identity dependency graph adds
+# hundreds of ms to startup, which other adapters shouldn't pay.
+# None = not attempted yet, False = unavailable, tuple = imported symbols.
+_agent_framework: Any = None
+
+
+def _lazy_import_agent_framework() -> Optional[Tuple[Any, Any, Any, Any, Any]]:
+    """Import the Agent Framework stack on first use, memoizing the result.
+
+    Returns:
+        (AzureAIAgent, Agent, Tool, RunContext, DefaultAzureCredential)
+        or None if the SDK is not installed.
+    """
+    global _agent_framework
+    if _agent_framework is None:
+        try:
+            from agent_framework_azure_ai import AzureAIAgent
+            from agent_framework import Agent, Tool, RunContext
+            from azure.identity import DefaultAzureCredential
+            _agent_framework = (
+                AzureAIAgent, Agent, Tool, RunContext, DefaultAzureCredential
+            )
+        except ImportError:
+            _agent_framework = False
+            logging.info(
+                "Microsoft Agent Framework not available. "
+                "Install with: pip install agent-framework-azure-ai --pre"
+            )
+    return _agent_framework or None
+
+
+def has_agent_framework() -> bool:
+    """Whether the Agent Framework SDK can be imported (memoized)."""
+    return _lazy_import_agent_framework() is not None
+
+
+class CachingTokenCredential:
+    """Delegating credential that caches tokens per scope tuple.
+
+    DefaultAzureCredential re-runs its probe chain and issues a token HTTP
+    call per request; caching until 5 minutes before expiry keeps the hot
+    run() path off the network and avoids IMDS throttling.
+    """
+
+    _REFRESH_MARGIN = 300  # seconds before expiry to refresh
+
+    def __init__(self, inner: Any) -> None:
+        self._inner = inner
+        self._tokens: Dict[Tuple[str, ...], AccessToken] = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        key = tuple(scopes)
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is not None and token.expires_on - time.time() > self._REFRESH_MARGIN:
+                return token
+            token = self._inner.get_token(*scopes, **kwargs)
+            self._tokens[key] = token
+            return token
+
+
+# Process-wide AzureAIAgent instances, keyed on (endpoint, model, credential).
+# Each agent owns an HTTP session and token provider, so per-request adapter
+# construction must not rebuild them.
+_AGENT_CACHE: Dict[Tuple[str, str, int], Any] = {}
+_AGENT_CACHE_LOCK = threading.Lock()
+
+# Shared empty context for run() calls without one; never mutated
+_EMPTY_CTX: Dict[str, Any] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_credential() -> Any:
+    """Build one process-wide DefaultAzureCredential with token caching.
+
+    Requests persistent token caching so short-lived processes (CLI,
+    serverless cold starts) reuse tokens across invocations; falls back to
+    in-memory caching on platforms without keyring support.
+    """
+    framework = _lazy_import_agent_framework()
+    if framework is None:
+        raise RuntimeError("azure.identity is not installed")
+    DefaultAzureCredential = framework[4]
+    try:
+        from azure.identity import TokenCachePersistenceOptions
+        inner = DefaultAzureCredential(
+            token_cache_persistence_options=TokenCachePersistenceOptions(
+                name="eventkit-foundry"
+            )
+        )
+    except Exception:
+        inner = DefaultAzureCredential()
+    return CachingTokenCredential(inner)
 
 
 class FoundryAdapter(UnifiedAdapter):
@@ -33,6 +130,8 @@ class FoundryAdapter(UnifiedAdapter):
     - Prompt Flow deployments
     """
 
+    __slots__ = ("agent", "project_endpoint", "credential", "model_deployment")
+
     def __init__(
         self,
         project_endpoint: Optional[str] = None,
@@ -54,7 +153,8 @@ class FoundryAdapter(UnifiedAdapter):
         # Initialize base adapter first
         super().__init__(AdapterType.FOUNDRY, settings=settings, **kwargs)
 
-        if not HAS_AGENT_FRAMEWORK:
+        framework = _lazy_import_agent_framework()
+        if framework is None:
             self.logger.warning(
                 "Microsoft Agent Framework not installed. "
                 "Install with: pip install agent-framework-azure-ai --pre"
@@ -62,36 +162,60 @@ class FoundryAdapter(UnifiedAdapter):
             self.agent = None
         else:
             self.project_endpoint = project_endpoint or self.settings.foundry_project_endpoint
-            self.credential = credential or DefaultAzureCredential()
+            self.credential = credential or _get_default_credential()
             self.model_deployment = model_deployment
 
             # Initialize Agent Framework
             self.agent = self._create_agent()
             self.logger.info(f"Agent Framework initialized with model: {model_deployment}")
 
-    def _create_agent(self) -> Optional[Agent]:
+    async def _dispatch_tool(
+        self,
+        tool_name: str,
+        params: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Shared async tool handler bound per tool via functools.partial."""
+        return await self.handle_tool_call_async(tool_name, params, ctx)
+
+    def _create_agent(self) -> Optional[AzureAIAgent]:
         """Create Agent Framework agent with EventKit tools."""
-        if not HAS_AGENT_FRAMEWORK:
+        framework = _lazy_import_agent_framework()
+        if framework is None:
             return None
+        AzureAIAgent, _, Tool, _, _ = framework
 
-        tools = [
-            Tool(
-                name=tool.name,
-                description=tool.description,
-                parameters=tool.parameters,
-                handler=lambda params, ctx, t=tool: self.handle_tool_call(
-                    t.name, params, ctx
+        cache_key = (
+            self.project_endpoint,
+            self.model_deployment,
+            id(self.credential),
+        )
+        with _AGENT_CACHE_LOCK:
+            agent = _AGENT_CACHE.get(cache_key)
+            if agent is not None:
+                return agent
+
+            # partial is C-implemented; one bound method is shared across
+            # tools instead of allocating a fresh closure per tool
+            tool_defs = tuple(self.tools.values())
+            tools = [
+                Tool(
+                    name=tool.name,
+                    description=tool.description,
+                    parameters=tool.parameters,
+                    handler=functools.partial(self._dispatch_tool, tool.name)
                 )
+                for tool in tool_defs
+            ]
+
+            agent = AzureAIAgent(
+                project_endpoint=self.project_endpoint,
+                credential=self.credential,
+                model_deployment=self.model_deployment,
+                tools=tools
             )
-            for tool in self.tools.values()
-        ]
-
-        return AzureAIAgent(
-            project_endpoint=self.project_endpoint,
-            credential=self.credential,
-            model_deployment=self.model_deployment,
-            tools=tools
-        )
+            _AGENT_CACHE[cache_key] = agent
+            return agent
 
     def _validate_parameters(
         self,
@@ -99,14 +223,19 @@ class FoundryAdapter(UnifiedAdapter):
         parameters: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Validate parameters for Foundry (Agent Framework format)."""
-        # Agent Framework provides validated params
-        # Just ensure required fields are present
-        required = tool.parameters.get("required", [])
-        for param_name in required:
-            if param_name not in parameters:
-                raise ValueError(f"Missing required parameter: {param_name}")
+        # Tools without required params skip validation work entirely
+        if not tool.required_params:
+            return {**tool.defaults, **parameters} if tool.defaults else parameters
+
+        # Required check is one C-speed set difference; the schema validator
+        # itself was compiled once at tool registration
+        missing = tool.required_params.difference(parameters)
+        if missing:
+            raise ValueError(f"Missing required parameters: {sorted(missing)}")
 
-        return parameters
+        merged = {**tool.defaults, **parameters} if tool.defaults else parameters
+        tool.validate(merged)
+        return merged
 
     def _transform_response(
         self,
@@ -126,6 +255,29 @@ class FoundryAdapter(UnifiedAdapter):
             }
         }
 
+    async def run_tool_calls(
+        self,
+        calls: list[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]]
+    ) -> list[Dict[str, Any]]:
+        """Execute independent tool calls concurrently.
+
+        When the agent emits K independent calls, dispatching them together
+        drops latency from the sum to the max of the tool durations. Each
+        sync handler runs in a worker thread so the event loop stays free.
+
+        Args:
+            calls: (tool_name, parameters, context) triples
+
+        Returns:
+            Results in call order; failures propagate as exceptions.
+        """
+        return await asyncio.gather(
+            *[
+                asyncio.to_thread(self.handle_tool_call, name, params, ctx)
+                for name, params, ctx in calls
+            ]
+        )
+
     async def run(self, message: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Run agent with message (Agent Framework API).
@@ -143,9 +295,10 @@ class FoundryAdapter(UnifiedAdapter):
                 "Install with: pip install agent-framework-azure-ai --pre"
             )
 
+        _, _, _, RunContext, _ = _lazy_import_agent_framework()
         run_context = RunContext(
             message=message,
-            context=context or {}
+            context=context if context else _EMPTY_CTX
         )
 
         response = await self.agent.run(run_context)
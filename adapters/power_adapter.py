@@ -7,9 +7,143 @@ Unified adapter for:
 - Logic Apps
 """
 
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple
+import json
 
-from adapters.base_adapter import UnifiedAdapter, AdapterType, ToolDefinition
+from pydantic import create_model
+
+from adapters.base_adapter import UnifiedAdapter, AdapterType, ToolDefinition, dumps
+
+# JSON-schema scalar types -> Python types for the generated models
+_TYPE_MAP = {
+    "string": str,
+    "integer": int,
+    "boolean": bool,
+    "number": float,
+}
+
+# Pydantic models compiled once per tool schema. Keyed on schema identity
+# with the schema stored alongside the model: an id alone can be reused by
+# a new schema once the old one is freed, which would validate against the
+# wrong model. Bounded LRU so discarded tools don't accumulate.
+_VALIDATOR_CACHE: OrderedDict = OrderedDict()
+_VALIDATOR_CACHE_MAX = 64
+
+
+def _model_for(tool: ToolDefinition) -> Any:
+    """Return a pydantic model mirroring the tool schema, built once.
+
+    Validation then runs inside pydantic-core instead of a per-parameter
+    Python loop.
+    """
+    key = id(tool.parameters)
+    hit = _VALIDATOR_CACHE.get(key)
+    if hit is not None and hit[0] is tool.parameters:
+        _VALIDATOR_CACHE.move_to_end(key)
+        return hit[1]
+    required = frozenset(tool.parameters.get("required", ()))
+    fields: Dict[str, Any] = {}
+    for name, schema in tool.parameters.get("properties", {}).items():
+        ptype = _TYPE_MAP.get(schema.get("type"), Any)
+        if name in required:
+            fields[name] = (ptype, ...)
+        else:
+            fields[name] = (Optional[ptype], schema.get("default"))
+    model = create_model(f"{tool.name}_params", **fields)
+    _VALIDATOR_CACHE[key] = (tool.parameters, model)
+    if len(_VALIDATOR_CACHE) > _VALIDATOR_CACHE_MAX:
+        _VALIDATOR_CACHE.popitem(last=False)
+    return model
+
+# Static response schemas, hoisted so spec generation shares them by
+# reference instead of reallocating identical nested dicts per tool
+_RESPONSE_SCHEMA_200 = {
+    "description": "Success",
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "object"},
+                    "status": {"type": "string"},
+                    "@odata.context": {"type": "string"},
+                    "@odata.type": {"type": "string"},
+                    "timestamp": {"type": "string"}
+                }
+            }
+        }
+    }
+}
+
+_RESPONSE_SCHEMA_400 = {
+    "description": "Bad Request",
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "error": {"type": "string"}
+                }
+            }
+        }
+    }
+}
+
+# Every tool path points at the shared component responses, so the
+# serialized spec carries the response schemas once instead of per tool
+_PATH_POST_RESPONSES = {
+    "200": {"$ref": "#/components/responses/EventKitResponse"},
+    "400": {"$ref": "#/components/responses/EventKitError"}
+}
+
+# Static spec sections, shared between dict and streaming generation
+_SPEC_INFO = {
+    "title": "EventKit API",
+    "version": "1.0.0",
+    "description": "EventKit session recommendation API for Power Platform integration"
+}
+
+_SPEC_SERVERS = [
+    {"url": "https://eventkit.azurewebsites.net", "description": "Production"},
+    {"url": "http://localhost:8010", "description": "Development"}
+]
+
+_SPEC_COMPONENTS = {
+    "securitySchemes": {
+        "apiKey": {
+            "type": "apiKey",
+            "in": "header",
+            "name": "X-API-Key"
+        }
+    },
+    "responses": {
+        "EventKitResponse": _RESPONSE_SCHEMA_200,
+        "EventKitError": _RESPONSE_SCHEMA_400
+    }
+}
+
+_SPEC_SECURITY = [{"apiKey": []}]
+
+
+def _build_path_item(tool: ToolDefinition) -> Dict[str, Any]:
+    """Build the OpenAPI path item for a single tool."""
+    return {
+        "post": {
+            "summary": tool.description,
+            "operationId": tool.name,
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        # shallow dict copy: json can't serialize mappingproxy
+                        "schema": dict(tool.parameters)
+                    }
+                }
+            },
+            "responses": _PATH_POST_RESPONSES
+        }
+    }
 
 
 class PowerAdapter(UnifiedAdapter):
@@ -22,9 +156,17 @@ class PowerAdapter(UnifiedAdapter):
     - Logic Apps
     """
 
+    __slots__ = ("_openapi_cache", "_openapi_tools_fingerprint", "_odata_contexts")
+
     def __init__(self, **kwargs):
         """Initialize Power Platform adapter."""
         super().__init__(AdapterType.POWER_PLATFORM, **kwargs)
+        self._openapi_cache: Optional[Dict[str, Any]] = None
+        self._openapi_tools_fingerprint: Optional[int] = None
+        # Loop-invariant @odata.context strings, formatted once per tool
+        self._odata_contexts: Dict[str, str] = {
+            name: f"$metadata#EventKit.{name}" for name in self.tools
+        }
 
     def _validate_parameters(
         self,
@@ -32,21 +174,11 @@ class PowerAdapter(UnifiedAdapter):
         parameters: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Validate parameters for Power Platform (OpenAPI format)."""
-        # Power Platform sends parameters in OpenAPI format
-        validated = {}
-
-        schema = tool.parameters.get("properties", {})
-        required = tool.parameters.get("required", [])
-
-        for param_name, param_schema in schema.items():
-            if param_name in parameters:
-                validated[param_name] = parameters[param_name]
-            elif "default" in param_schema:
-                validated[param_name] = param_schema["default"]
-            elif param_name in required:
-                raise ValueError(f"Missing required parameter: {param_name}")
-
-        return validated
+        # Power Platform sends parameters in OpenAPI format; validation runs
+        # in pydantic-core via a model compiled once per tool schema.
+        # ValidationError subclasses ValueError, so callers see the same type.
+        model = _model_for(tool)
+        return model.model_validate(parameters).model_dump(exclude_none=True)
 
     def _transform_response(
         self,
@@ -56,10 +188,15 @@ class PowerAdapter(UnifiedAdapter):
     ) -> Dict[str, Any]:
         """Transform response for Power Platform (OpenAPI response format)."""
         # Power Platform expects OpenAPI-compliant response
+        odata_context = self._odata_contexts.get(tool.name)
+        if odata_context is None:
+            odata_context = self._odata_contexts[tool.name] = (
+                f"$metadata#EventKit.{tool.name}"
+            )
         return {
             "value": result.get("result", {}),
             "status": result.get("status", "success"),
-            "@odata.context": f"$metadata#EventKit.{tool.name}",
+            "@odata.context": odata_context,
             "@odata.type": "#EventKit.Response",
             "timestamp": result.get("timestamp")
         }
@@ -68,79 +205,77 @@ class PowerAdapter(UnifiedAdapter):
         """
         Generate OpenAPI specification for Power Platform.
 
+        The spec is cached against a fingerprint of the tool registry, so a
+        stable registry serves the same dict after the first build.
+
         Returns:
             OpenAPI 3.0 specification
         """
-        paths = {}
+        tools = tuple(self.tools.values())
+        fingerprint = hash(tuple((t.name, id(t.parameters)) for t in tools))
+        if (
+            self._openapi_cache is not None
+            and fingerprint == self._openapi_tools_fingerprint
+        ):
+            return self._openapi_cache
 
-        for tool in self.tools.values():
-            paths[f"/{tool.name}"] = {
-                "post": {
-                    "summary": tool.description,
-                    "operationId": tool.name,
-                    "requestBody": {
-                        "required": True,
-                        "content": {
-                            "application/json": {
-                                "schema": tool.parameters
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Success",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "value": {"type": "object"},
-                                            "status": {"type": "string"},
-                                            "@odata.context": {"type": "string"},
-                                            "@odata.type": {"type": "string"},
-                                            "timestamp": {"type": "string"}
-                                        }
-                                    }
-                                }
-                            }
-                        },
-                        "400": {
-                            "description": "Bad Request",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "error": {"type": "string"}
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
+        # dict(zip(...)) populates the mapping in C instead of a Python loop
+        paths = dict(zip(
+            (f"/{t.name}" for t in tools),
+            (_build_path_item(t) for t in tools),
+        ))
 
-        return {
+        spec = {
             "openapi": "3.0.0",
-            "info": {
-                "title": "EventKit API",
-                "version": "1.0.0",
-                "description": "EventKit session recommendation API for Power Platform integration"
-            },
-            "servers": [
-                {"url": "https://eventkit.azurewebsites.net", "description": "Production"},
-                {"url": "http://localhost:8010", "description": "Development"}
-            ],
+            "info": _SPEC_INFO,
+            "servers": _SPEC_SERVERS,
             "paths": paths,
-            "components": {
-                "securitySchemes": {
-                    "apiKey": {
-                        "type": "apiKey",
-                        "in": "header",
-                        "name": "X-API-Key"
-                    }
-                }
-            },
-            "security": [{"apiKey": []}]
+            "components": _SPEC_COMPONENTS,
+            "security": _SPEC_SECURITY
         }
+
+        self._openapi_cache = spec
+        self._openapi_tools_fingerprint = fingerprint
+        return spec
+
+    def get_openapi_spec_bytes(self) -> bytes:
+        """Serialize the spec to JSON bytes, using orjson when available.
+
+        HTTP layers can hand these bytes straight to the response instead
+        of re-encoding the dict with stdlib json.
+        """
+        return dumps(self.get_openapi_spec())
+
+    def iter_openapi_paths(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (path, path item) pairs one tool at a time.
+
+        Lets callers stream the spec instead of materializing the whole
+        nested dict for large tool registries.
+        """
+        for tool in self.tools.values():
+            yield f"/{tool.name}", _build_path_item(tool)
+
+    def write_openapi_spec(self, fp: TextIO) -> None:
+        """Stream the OpenAPI spec to a file object, one path at a time.
+
+        Peak memory stays at a single path item rather than the full spec
+        plus its serialized buffer.
+        """
+        fp.write('{"openapi": "3.0.0", "info": ')
+        json.dump(_SPEC_INFO, fp)
+        fp.write(', "servers": ')
+        json.dump(_SPEC_SERVERS, fp)
+        fp.write(', "paths": {')
+        first = True
+        for path, item in self.iter_openapi_paths():
+            if not first:
+                fp.write(", ")
+            first = False
+            json.dump(path, fp)
+            fp.write(": ")
+            json.dump(item, fp)
+        fp.write('}, "components": ')
+        json.dump(_SPEC_COMPONENTS, fp)
+        fp.write(', "security": ')
+        json.dump(_SPEC_SECURITY, fp)
+        fp.write('}')
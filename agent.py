@@ -11,10 +11,36 @@ Usage:
 """
 
 from __future__ import annotations
-import json, argparse, pathlib, urllib.parse, time
+import functools
+import hashlib
+import hmac
+import json, argparse, heapq, pathlib, re, urllib.parse, time
 import os
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import List, Dict, Any, Optional
+import secrets
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from array import array
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import numpy as np  # vectorized scoring (optional)
+except ImportError:  # pragma: no cover
+    np = None
+
+# orjson serializes in C and emits bytes directly (optional). Network
+# responses use it; CLI stdout keeps stdlib json with indent=2 for humans.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:  # pragma: no cover
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 MANIFEST_PATH = pathlib.Path(__file__).parent / "agent.json"
 try:
@@ -38,56 +64,51 @@ class SecurityValidator:
     MAX_INTERESTS_LENGTH = 500
     MAX_USER_ID_LENGTH = 255
     MAX_TITLE_LENGTH = 200
-    VALID_INTERESTS_PATTERN = r'^[a-zA-Z0-9\s,\-]+$'
-    VALID_EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    VALID_TITLE_PATTERN = r'^[a-zA-Z0-9\s,\-:?!\(\)\'\.]+$'
-    
+    # Compiled once at class definition; the validators run per HTTP request
+    _INTERESTS_RE = re.compile(r'^[a-zA-Z0-9\s,\-]+$')
+    _EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    _TITLE_RE = re.compile(r'^[a-zA-Z0-9\s,\-:?!\(\)\'\.]+$')
+
     @staticmethod
     def validate_interests(interests: str) -> tuple[bool, str]:
         """Validate interests string."""
-        import re
-        
         if not interests or not interests.strip():
             return False, "Interests cannot be empty"
-        
+
         if len(interests) > SecurityValidator.MAX_INTERESTS_LENGTH:
             return False, f"Interests too long (max {SecurityValidator.MAX_INTERESTS_LENGTH} chars)"
-        
-        if not re.match(SecurityValidator.VALID_INTERESTS_PATTERN, interests):
+
+        if not SecurityValidator._INTERESTS_RE.match(interests):
             return False, "Interests contain invalid characters"
-        
+
         return True, ""
-    
+
     @staticmethod
     def validate_user_id(user_id: str) -> tuple[bool, str]:
         """Validate user ID (email format)."""
-        import re
-        
         if not user_id or not user_id.strip():
             return False, "User ID cannot be empty"
-        
+
         if len(user_id) > SecurityValidator.MAX_USER_ID_LENGTH:
             return False, f"User ID too long (max {SecurityValidator.MAX_USER_ID_LENGTH} chars)"
-        
-        if not re.match(SecurityValidator.VALID_EMAIL_PATTERN, user_id):
+
+        if not SecurityValidator._EMAIL_RE.match(user_id):
             return False, "User ID must be a valid email address"
-        
+
         return True, ""
-    
+
     @staticmethod
     def validate_session_title(title: str) -> tuple[bool, str]:
         """Validate session title."""
-        import re
-        
         if not title or not title.strip():
             return False, "Session title cannot be empty"
-        
+
         if len(title) > SecurityValidator.MAX_TITLE_LENGTH:
             return False, f"Session title too long (max {SecurityValidator.MAX_TITLE_LENGTH} chars)"
-        
-        if not re.match(SecurityValidator.VALID_TITLE_PATTERN, title):
+
+        if not SecurityValidator._TITLE_RE.match(title):
             return False, "Session title contains invalid characters"
-        
+
         return True, ""
 
 
@@ -103,41 +124,98 @@ class RateLimiter:
         """
         self.requests_per_minute = requests_per_minute
         self.window_seconds = window_seconds
-        self.request_log: Dict[str, List[float]] = {}
-    
+        # Per IP: [buckets, last_sec, total] — a ring of 1-second count
+        # buckets, the second it was last advanced to, and a running sum.
+        # Constant memory per IP regardless of traffic, O(1) admission.
+        self.request_log: Dict[str, List[Any]] = {}
+        # Amortized GC: sweep idle IPs every _gc_every calls instead of
+        # letting callers schedule full scans
+        self._calls_since_gc = 0
+        self._gc_every = 1024
+        # Guards request_log under the threaded HTTP server
+        self._lock = threading.Lock()
+
+    def _advance(self, entry: List[Any], cur: int) -> None:
+        """Zero out buckets that have aged past the window edge."""
+        buckets, last_sec, total = entry
+        elapsed = cur - last_sec
+        if elapsed <= 0:
+            return
+        w = self.window_seconds
+        if elapsed >= w:
+            for i in range(w):
+                buckets[i] = 0
+            total = 0
+        else:
+            for i in range(1, elapsed + 1):
+                slot = (last_sec + i) % w
+                total -= buckets[slot]
+                buckets[slot] = 0
+        entry[1] = cur
+        entry[2] = total
+
     def is_allowed(self, ip: str) -> bool:
         """Check if request from IP is allowed."""
-        now = time.time()
-        
-        # Initialize IP log if needed
-        if ip not in self.request_log:
-            self.request_log[ip] = []
-        
-        # Remove old requests outside the window
-        self.request_log[ip] = [
-            ts for ts in self.request_log[ip]
-            if now - ts < self.window_seconds
-        ]
-        
-        # Check if under limit
-        if len(self.request_log[ip]) < self.requests_per_minute:
-            self.request_log[ip].append(now)
-            return True
-        
-        return False
-    
+        with self._lock:
+            self._calls_since_gc += 1
+            if self._calls_since_gc >= self._gc_every:
+                self._calls_since_gc = 0
+                self._cleanup()
+            cur = int(time.time())
+            entry = self.request_log.get(ip)
+            if entry is None:
+                entry = self.request_log[ip] = [
+                    array("I", [0]) * self.window_seconds, cur, 0
+                ]
+            else:
+                self._advance(entry, cur)
+
+            # Check if under limit
+            if entry[2] < self.requests_per_minute:
+                entry[0][cur % self.window_seconds] += 1
+                entry[2] += 1
+                return True
+
+            return False
+
+    def _cleanup(self) -> None:
+        """Drop idle IPs; the caller must hold the lock."""
+        cur = int(time.time())
+        for ip in list(self.request_log):
+            if cur - self.request_log[ip][1] >= self.window_seconds:
+                del self.request_log[ip]
+
     def cleanup_old_entries(self) -> None:
         """Remove IPs with no recent requests."""
-        now = time.time()
-        self.request_log = {
-            ip: timestamps
-            for ip, timestamps in self.request_log.items()
-            if any(now - ts < self.window_seconds for ts in timestamps)
-        }
+        with self._lock:
+            self._cleanup()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_manifest_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse the manifest once per (path, mtime, size) triple."""
+    return json.loads(pathlib.Path(path_str).read_text())
 
 
 def load_manifest(path: pathlib.Path = MANIFEST_PATH) -> Dict[str, Any]:
-    return json.loads(path.read_text())
+    st = path.stat()
+    return _load_manifest_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_external_sessions(path_str: str, mtime_ns: int, size: int) -> List[Dict[str, Any]]:
+    """Parse an external sessions file once per (path, mtime, size) triple.
+
+    The cached list is shared between callers and must not be mutated; a
+    stable identity also lets the scoring matrix cache hit across requests.
+    """
+    try:
+        data = json.loads(pathlib.Path(path_str).read_text())
+        if isinstance(data, list):
+            return [d for d in data if isinstance(d, dict)]
+    except Exception:
+        return []
+    return []
 
 
 def _load_external_sessions(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -158,13 +236,8 @@ def _load_external_sessions(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
                 p = alt2
     if not p.exists():
         return []
-    try:
-        data = json.loads(p.read_text())
-        if isinstance(data, list):
-            return [d for d in data if isinstance(d, dict)]
-    except Exception:
-        return []
-    return []
+    st = p.stat()
+    return _read_external_sessions(str(p), st.st_mtime_ns, st.st_size)
 
 
 def get_sessions(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -172,23 +245,38 @@ def get_sessions(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
     return external if external else manifest.get("sessions", [])
 
 
-def _normalize_interests(raw: str) -> List[str]:
+@functools.lru_cache(maxsize=4096)
+def _normalize_interests_cached(raw: str) -> Tuple[str, ...]:
+    """Normalize a raw interests string, memoized on the exact input."""
     norm = raw.replace(";", ",").lower()
-    return [t.strip() for t in norm.split(",") if t.strip()]
+    return tuple(t.strip() for t in norm.split(",") if t.strip())
 
 
-def load_profile(file: str, key: str) -> List[str]:
-    p = pathlib.Path(file).expanduser()
-    if not p.exists():
-        return []
+def _normalize_interests(raw: str) -> List[str]:
+    return list(_normalize_interests_cached(raw))
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_profile_cached(
+    path_str: str, mtime_ns: int, size: int, key: str
+) -> Tuple[str, ...]:
+    """Read one profile key, cached until the storage file changes."""
     try:
-        data = json.loads(p.read_text())
+        data = json.loads(pathlib.Path(path_str).read_text())
         val = data.get(key)
         if isinstance(val, list):
-            return [str(v).lower() for v in val]
+            return tuple(str(v).lower() for v in val)
     except Exception:
+        return ()
+    return ()
+
+
+def load_profile(file: str, key: str) -> List[str]:
+    p = pathlib.Path(file).expanduser()
+    if not p.exists():
         return []
-    return []
+    st = p.stat()
+    return list(_load_profile_cached(str(p), st.st_mtime_ns, st.st_size, key))
 
 
 def save_profile(file: str, key: str, interests: List[str]) -> None:
@@ -203,12 +291,301 @@ def save_profile(file: str, key: str, interests: List[str]) -> None:
     p.write_text(json.dumps(data, indent=2))
 
 
-def score_session(
-    session: Dict[str, Any], interests: List[str], w: Dict[str, float]
+# One lock guards every module-level LRU below: serve handles requests on
+# concurrent threads (ThreadingHTTPServer), and the unsynchronized
+# get / move_to_end pair can race an eviction into a KeyError. Values are
+# built outside the lock; a duplicate build on a miss race is harmless.
+_CACHE_LOCK = threading.Lock()
+
+# Struct-of-Arrays scoring inputs, built once per session list. Keyed on the
+# list's id with the list itself kept alongside to guard against id reuse.
+# Bounded LRU like _RECOMMEND_RESULT_CACHE: matrices are the largest cached
+# objects, so the cap is small.
+_MATRIX_CACHE: OrderedDict = OrderedDict()
+_MATRIX_CACHE_MAX = 8
+
+
+def _build_session_matrix(
+    sessions: List[Dict[str, Any]]
+) -> Tuple[Dict[str, int], Any, Any]:
+    """Build (tag_index, tag_matrix, popularity, packed_bits) for a session list.
+
+    tag_matrix is a float32 [n_sessions, n_tags] presence matrix: contiguous
+    and BLAS-ready, so scoring the whole pool is one matrix-vector product
+    instead of per-session membership loops. packed_bits is the same matrix
+    bit-packed for popcount scoring on NumPy >= 2.0, or None.
+    """
+    with _CACHE_LOCK:
+        cached = _MATRIX_CACHE.get(id(sessions))
+        if cached is not None and cached[0] is sessions:
+            _MATRIX_CACHE.move_to_end(id(sessions))
+            return cached[1]
+    tag_index: Dict[str, int] = {}
+    rows: List[List[str]] = []
+    pop: List[float] = []
+    for s in sessions:
+        tags = [t.lower() for t in s.get("tags") or s.get("keywords", [])]
+        for t in tags:
+            if t not in tag_index:
+                tag_index[t] = len(tag_index)
+        rows.append(tags)
+        pop.append(s.get("popularity", 0))
+    matrix = np.zeros((len(sessions), len(tag_index)), dtype=np.float32)
+    for i, tags in enumerate(rows):
+        for t in tags:
+            matrix[i, tag_index[t]] = 1.0
+    # Tag vectors are binary, so 1 bit per tag suffices: packed rows cut
+    # memory traffic 32x and hits become a SIMD popcount. bitwise_count
+    # needs NumPy >= 2.0; older installs keep the float path.
+    if hasattr(np, "bitwise_count"):
+        bits = np.packbits(matrix.astype(bool), axis=1)
+    else:
+        bits = None
+    built = (tag_index, matrix, np.asarray(pop, dtype=np.float32), bits)
+    with _CACHE_LOCK:
+        _MATRIX_CACHE[id(sessions)] = (sessions, built)
+        if len(_MATRIX_CACHE) > _MATRIX_CACHE_MAX:
+            _MATRIX_CACHE.popitem(last=False)
+    return built
+
+
+# Numba kernel, imported on first use. None = not attempted, False = absent.
+_numba_score_all: Any = None
+
+
+def _load_numba_kernel() -> Optional[Any]:
+    """Import the optional numba scoring kernel, memoizing the result."""
+    global _numba_score_all
+    if _numba_score_all is None:
+        try:
+            from scoring_numba import score_all
+            _numba_score_all = score_all
+        except ImportError:
+            _numba_score_all = False
+    return _numba_score_all or None
+
+
+def _top_k_indices(scores: Any, k: int) -> Any:
+    """Indices of the k best scores, ordered best-first.
+
+    argpartition selects in O(N); only the k winners are then sorted,
+    versus O(N log N) for ordering the whole pool.
+    """
+    if k < len(scores):
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(len(scores))
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+class _BatchScorer:
+    """Coalesce concurrent interest matvecs into one matrix product.
+
+    Under the threaded server, /recommend requests landing within the
+    same couple of milliseconds each need ``matrix @ v`` over the same
+    session matrix. The matvec is memory-bandwidth bound, so stacking
+    the pending query vectors and issuing a single ``matrix @ V.T``
+    streams the matrix once for the whole batch instead of once per
+    request. Disabled by default (CLI calls should not pay the batching
+    window); serve enables it behind ``features.batchScoring``.
+    """
+
+    _MAX_BATCH = 16
+    _WINDOW_S = 0.002
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Tuple[Any, Future]]" = queue.Queue()
+        self._matrix: Any = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._matrix is not None
+
+    def enable(self, matrix: Any) -> None:
+        """Bind to the serve-time session matrix and start the worker."""
+        self._matrix = matrix
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="batch-score"
+            )
+            self._thread.start()
+
+    def submit(self, matrix: Any, v: Any) -> Optional[Future]:
+        """Queue ``matrix @ v``; None means the caller must compute it.
+
+        Only vectors against the bound matrix are batchable — a request
+        scoring a different session list (e.g. external sessions) falls
+        back to its own matvec.
+        """
+        if matrix is not self._matrix:
+            return None
+        fut: Future = Future()
+        self._queue.put((v, fut))
+        return fut
+
+    def _run(self) -> None:
+        while True:
+            v, fut = self._queue.get()
+            batch = [(v, fut)]
+            deadline = time.monotonic() + self._WINDOW_S
+            while len(batch) < self._MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                if len(batch) == 1:
+                    fut.set_result(self._matrix @ v)
+                else:
+                    stacked = np.stack([item[0] for item in batch])
+                    # One GEMM; column j holds request j's hit counts
+                    hits = self._matrix @ stacked.T
+                    for j, (_, f) in enumerate(batch):
+                        f.set_result(hits[:, j])
+            except Exception as exc:  # surface on the waiting request
+                for _, f in batch:
+                    if not f.done():
+                        f.set_exception(exc)
+
+
+_BATCH_SCORER = _BatchScorer()
+
+
+def _recommend_vectorized(
+    manifest: Dict[str, Any],
+    sessions: List[Dict[str, Any]],
+    interests: List[str],
+    top_n: int,
+    w: Dict[str, float],
 ) -> Dict[str, Any]:
-    tags = [t.lower() for t in session.get("tags", [])]
-    interest_hits = sum(1 for t in tags if t in interests)
-    diversity_component = len(set(interests)) * 0.01 * w["diversity"]
+    """NumPy path for recommend: score all sessions in one array pass."""
+    tag_index, matrix, pop, bits = _build_session_matrix(sessions)
+    # Dedupe while keeping order: a repeated interest must count once, or
+    # the kernel/recompute paths would score duplicate columns as extra hits
+    cols = list(dict.fromkeys(tag_index[t] for t in interests if t in tag_index))
+    diversity = len(set(interests)) * 0.01 * w["diversity"]
+    kernel = (
+        _load_numba_kernel()
+        if manifest.get("features", {}).get("numbaScoring")
+        else None
+    )
+    if kernel is not None:
+        scores = kernel(
+            matrix,
+            np.asarray(cols, dtype=np.int64),
+            pop,
+            w["interest"],
+            w["popularity"],
+            w["diversity"],
+            len(set(interests)),
+        )
+        hits = None  # recomputed below for the few chosen rows only
+    else:
+        if cols and bits is not None:
+            # Popcount over bit-packed rows: same intersection counts as
+            # the float product at a fraction of the bytes streamed
+            mask = np.zeros(matrix.shape[1], dtype=bool)
+            mask[cols] = True
+            hits = np.bitwise_count(bits & np.packbits(mask)).sum(
+                axis=1, dtype=np.int32
+            )
+        elif cols:
+            # One BLAS matrix-vector product scores the whole pool; the
+            # interest indicator vector plays the role of the query vector
+            v = np.zeros(matrix.shape[1], dtype=np.float32)
+            v[cols] = 1.0
+            fut = (
+                _BATCH_SCORER.submit(matrix, v)
+                if _BATCH_SCORER.enabled
+                else None
+            )
+            hits = fut.result() if fut is not None else matrix @ v
+        else:
+            hits = np.zeros(len(sessions), dtype=np.float32)
+        scores = hits * w["interest"] + pop * w["popularity"] + diversity
+    idx = _top_k_indices(scores, min(top_n, len(sessions)))
+    if hits is None:
+        hits = {int(i): int(matrix[i, cols].sum()) if cols else 0 for i in idx}
+    ranked_sessions = [sessions[i] for i in idx]
+    return {
+        "sessions": ranked_sessions,
+        "scoring": [
+            {
+                "title": sessions[i]["title"],
+                "score": float(scores[i]),
+                "contributions": {
+                    "interest_match": float(hits[i]) * w["interest"],
+                    "popularity": sessions[i].get("popularity", 0) * w["popularity"],
+                    "diversity": diversity,
+                },
+            }
+            for i in idx
+        ],
+        "conflicts": _count_conflicts(ranked_sessions),
+    }
+
+
+# Lowercased tag sets (plus the global tag vocabulary) per session list,
+# built once and kept out of the session dicts themselves so responses
+# stay JSON-serializable. Bounded so dropped session lists don't pin
+# entries forever.
+_TAG_SET_CACHE: OrderedDict = OrderedDict()
+_TAG_SET_CACHE_MAX = 32
+
+
+def _session_tag_sets(
+    sessions: List[Dict[str, Any]]
+) -> Tuple[List[frozenset], frozenset]:
+    """Return (per-session tag sets, global tag vocabulary) for a session list."""
+    with _CACHE_LOCK:
+        cached = _TAG_SET_CACHE.get(id(sessions))
+        if cached is not None and cached[0] is sessions:
+            _TAG_SET_CACHE.move_to_end(id(sessions))
+            return cached[1], cached[2]
+    sets = [
+        frozenset(t.lower() for t in s.get("tags") or s.get("keywords", []))
+        for s in sessions
+    ]
+    vocab = frozenset().union(*sets) if sets else frozenset()
+    with _CACHE_LOCK:
+        _TAG_SET_CACHE[id(sessions)] = (sessions, sets, vocab)
+        if len(_TAG_SET_CACHE) > _TAG_SET_CACHE_MAX:
+            _TAG_SET_CACHE.popitem(last=False)
+    return sets, vocab
+
+
+# Lowercased-title lookup per session list, built once for O(1) explain.
+# Bounded LRU, same shape as the caches above.
+_TITLE_INDEX_CACHE: OrderedDict = OrderedDict()
+_TITLE_INDEX_CACHE_MAX = 32
+
+
+def _session_title_index(sessions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Return a {lowercased title: session} index for a session list."""
+    with _CACHE_LOCK:
+        cached = _TITLE_INDEX_CACHE.get(id(sessions))
+        if cached is not None and cached[0] is sessions:
+            _TITLE_INDEX_CACHE.move_to_end(id(sessions))
+            return cached[1]
+    index = {s["title"].lower(): s for s in sessions if "title" in s}
+    with _CACHE_LOCK:
+        _TITLE_INDEX_CACHE[id(sessions)] = (sessions, index)
+        if len(_TITLE_INDEX_CACHE) > _TITLE_INDEX_CACHE_MAX:
+            _TITLE_INDEX_CACHE.popitem(last=False)
+    return index
+
+
+def _score_from_hits(
+    session: Dict[str, Any],
+    interest_hits: int,
+    n_unique_interests: int,
+    w: Dict[str, float],
+) -> Dict[str, Any]:
+    diversity_component = n_unique_interests * 0.01 * w["diversity"]
     contributions = {
         "interest_match": interest_hits * w["interest"],
         "popularity": session.get("popularity", 0) * w["popularity"],
@@ -218,13 +595,37 @@ def score_session(
     return {"session": session, "score": total, "contributions": contributions}
 
 
+def score_session(
+    session: Dict[str, Any], interests: List[str], w: Dict[str, float]
+) -> Dict[str, Any]:
+    tags = frozenset(
+        t.lower() for t in session.get("tags") or session.get("keywords", [])
+    )
+    interests_set = frozenset(interests)
+    return _score_from_hits(session, len(tags & interests_set), len(interests_set), w)
+
+
 def recommend(
     manifest: Dict[str, Any], interests: List[str], top_n: int
 ) -> Dict[str, Any]:
     w = manifest["weights"]
     sessions = get_sessions(manifest)
-    scored = [score_session(s, interests, w) for s in sessions]
-    ranked = sorted(scored, key=lambda x: x["score"], reverse=True)[:top_n]
+    if np is not None and sessions:
+        return _recommend_vectorized(manifest, sessions, interests, top_n, w)
+    # O(1) set intersections against tag sets built once per session list
+    tag_sets, vocab = _session_tag_sets(sessions)
+    interests_set = frozenset(interests)
+    # Interests absent from every session can't score a hit; intersecting
+    # with the smaller effective set saves hashing per session. Diversity
+    # still counts what the user actually typed.
+    effective = interests_set & vocab
+    n_unique = len(interests_set)
+    scored = [
+        _score_from_hits(s, len(tag_sets[i] & effective), n_unique, w)
+        for i, s in enumerate(sessions)
+    ]
+    # O(N log k) partial selection instead of sorting the whole pool
+    ranked = heapq.nlargest(top_n, scored, key=lambda x: x["score"])
     conflicts = _count_conflicts([r["session"] for r in ranked])
     return {
         "sessions": [r["session"] for r in ranked],
@@ -240,30 +641,66 @@ def recommend(
     }
 
 
+# Bounded LRU of recommend results, keyed on (manifest identity, sorted
+# interests, top_n). Scoring is order-invariant over interests, so sorting
+# the key lets permutations of the same set share one entry. The manifest
+# ref is stored to guard against id reuse; cached results must be treated
+# as read-only by callers.
+_RECOMMEND_RESULT_CACHE: OrderedDict = OrderedDict()
+_RECOMMEND_RESULT_CACHE_MAX = 512
+
+
+def _recommend_cached(
+    manifest: Dict[str, Any], interests: List[str], top_n: int
+) -> Dict[str, Any]:
+    key = (id(manifest), tuple(sorted(interests)), top_n)
+    with _CACHE_LOCK:
+        hit = _RECOMMEND_RESULT_CACHE.get(key)
+        if hit is not None and hit[0] is manifest:
+            _RECOMMEND_RESULT_CACHE.move_to_end(key)
+            return hit[1]
+    result = recommend(manifest, interests, top_n)
+    with _CACHE_LOCK:
+        _RECOMMEND_RESULT_CACHE[key] = (manifest, result)
+        if len(_RECOMMEND_RESULT_CACHE) > _RECOMMEND_RESULT_CACHE_MAX:
+            _RECOMMEND_RESULT_CACHE.popitem(last=False)
+    return result
+
+
 def explain(
     manifest: Dict[str, Any], title: str, interests: List[str]
 ) -> Dict[str, Any]:
     w = manifest["weights"]
     sessions = get_sessions(manifest)
-    session = next((s for s in sessions if s["title"].lower() == title.lower()), None)
+    session = _session_title_index(sessions).get(title.lower())
     if not session:
         return {"error": "session not found", "title": title}
     detail = score_session(session, interests, w)
+    interests_set = frozenset(interests)
     return {
         "title": session["title"],
         "score": detail["score"],
         "contributions": detail["contributions"],
-        "matched_tags": [t for t in session.get("tags", []) if t.lower() in interests],
+        "matched_tags": [
+            t
+            for t in session.get("tags") or session.get("keywords", [])
+            if t.lower() in interests_set
+        ],
     }
 
 
 def _count_conflicts(sessions: List[Dict[str, Any]]) -> int:
-    slots = {}
+    # Single pass: a slot becomes a conflict the moment it gains a second
+    # occupant, so no second scan over the counts is needed
+    seen: Dict[Tuple[Any, Any], int] = {}
+    conflicts = 0
     for s in sessions:
         slot = (s.get("start"), s.get("end"))
-        slots.setdefault(slot, 0)
-        slots[slot] += 1
-    return sum(1 for v in slots.values() if v > 1)
+        count = seen.get(slot, 0)
+        if count == 1:
+            conflicts += 1
+        seen[slot] = count + 1
+    return conflicts
 
 
 def _build_itinerary_markdown(interests: List[str], recommendation: Dict[str, Any]) -> str:
@@ -288,53 +725,171 @@ def _build_itinerary_markdown(interests: List[str], recommendation: Dict[str, An
     return "\n".join(lines)
 
 
+# Bounded LRU of rendered itineraries. The recommend-result cache hands
+# back identity-stable rec dicts for repeated queries, so keying on the
+# object identity (with the ref held to guard id reuse) is exact.
+_ITINERARY_MD_CACHE: OrderedDict = OrderedDict()
+_ITINERARY_MD_CACHE_MAX = 256
+
+
+def _itinerary_markdown_cached(
+    interests: List[str], rec: Dict[str, Any]
+) -> Tuple[str, bytes]:
+    """Return (markdown, utf-8 bytes), rendered and encoded at most once.
+
+    The str feeds the JSON response; the bytes feed the file writer and
+    raw-markdown responses without a second encode pass.
+    """
+    key = (tuple(interests), id(rec))
+    with _CACHE_LOCK:
+        hit = _ITINERARY_MD_CACHE.get(key)
+        if hit is not None and hit[0] is rec:
+            _ITINERARY_MD_CACHE.move_to_end(key)
+            return hit[1], hit[2]
+    md = _build_itinerary_markdown(interests, rec)
+    md_bytes = md.encode("utf-8")
+    with _CACHE_LOCK:
+        _ITINERARY_MD_CACHE[key] = (rec, md, md_bytes)
+        if len(_ITINERARY_MD_CACHE) > _ITINERARY_MD_CACHE_MAX:
+            _ITINERARY_MD_CACHE.popitem(last=False)
+    return md, md_bytes
+
+
+@functools.lru_cache(maxsize=1024)
+def _itinerary_slug(interests: Tuple[str, ...]) -> str:
+    """Hash the leading interests into a fixed-width filename slug.
+
+    Interests are client input on the serve path; hashing keeps path
+    separators and ``..`` sequences out of the export filename entirely,
+    and the digest is stable so repeated queries hit the same artifact.
+    """
+    return hashlib.blake2s(
+        "_".join(interests).encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+
+def _itinerary_filename(interests: List[str]) -> str:
+    """Return the export artifact name for an interest list."""
+    return f"itinerary_{_itinerary_slug(tuple(interests[:3]))}.md"
+
+
+@dataclass(frozen=True, slots=True)
+class _ServeConfig:
+    """Per-server constants resolved once at startup.
+
+    Handlers read these as attribute lookups on a slotted instance instead
+    of chained dict walks against the manifest and environment per request.
+    """
+
+    default_top: int
+    storage_file: Optional[str]
+    export_dir: Optional[pathlib.Path]
+    expected_auth: Optional[bytes]
+
+
+# Deterministic serve endpoints whose 200 responses may be cached by
+# clients and reverse proxies for a short window
+_CACHEABLE_ACTIONS = frozenset({"recommend", "recommend_graph", "explain", "export"})
+
+# Responses above the threshold stream as chunked transfer encoding in
+# _CHUNK_SIZE pieces; smaller ones go out in one Content-Length write
+_CHUNK_THRESHOLD = 64 * 1024
+_CHUNK_SIZE = 16 * 1024
+
+
+class _ExportWriter:
+    """Background writer for exported itinerary files.
+
+    The markdown is already in the JSON response, so the saved artifact is
+    non-critical; queuing the write keeps disk latency out of the /export
+    response path. The queue is bounded — if the disk can't keep up, the
+    submitting thread blocks rather than growing without limit.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while True:
+            path, data = self._queue.get()
+            try:
+                with open(path, "wb", buffering=1 << 16) as f:
+                    f.write(data)
+            except OSError:
+                pass  # non-critical artifact; the response already carried it
+            finally:
+                self._queue.task_done()
+
+    def submit(self, path: pathlib.Path, data: bytes) -> None:
+        """Queue a file write, starting the worker thread on first use."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="export-writer", daemon=True
+            )
+            self._thread.start()
+        self._queue.put((path, data))
+
+    def drain(self) -> None:
+        """Block until every queued write has hit disk."""
+        if self._thread is not None:
+            self._queue.join()
+
+
+_EXPORT_WRITER = _ExportWriter()
+
+
+# Static card header, shared by every rendered card
+_CARD_HEADER = {
+    "type": "TextBlock",
+    "text": "Event Recommendations",
+    "weight": "Bolder",
+    "size": "Medium",
+}
+
+
 def _build_adaptive_card(sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
-    body = []
-    actions = []
-    for i, s in enumerate(sessions, start=1):
-        body.append(
-            {
-                "type": "Container",
-                "items": [
-                    {
-                        "type": "TextBlock",
-                        "text": f"{i}. {s['title']}",
-                        "weight": "Bolder",
-                    },
-                    {
-                        "type": "TextBlock",
-                        "text": f"{s.get('start', '?')} - {s.get('end', '?')} @ {s.get('location', '?')}",
-                        "isSubtle": True,
-                        "spacing": "None",
-                    },
-                ],
-            }
-        )
-        actions.append(
-            {
-                "type": "Action.Submit",
-                "title": f"Explain #{i}",
-                "data": {
-                    "action": "explainSession",
-                    "sessionTitle": s["title"],
-                    "start": s.get("start"),
-                    "end": s.get("end"),
-                    "room": s.get("location"),
+    # Preallocate both lists and fill by index: no append resizing and no
+    # header-list concatenation at the end
+    n = len(sessions)
+    body: List[Any] = [_CARD_HEADER] * (n + 1)
+    actions: List[Any] = [None] * n
+    for i, s in enumerate(sessions):
+        title = s["title"]
+        start = s.get("start")
+        end = s.get("end")
+        location = s.get("location")
+        body[i + 1] = {
+            "type": "Container",
+            "items": [
+                {
+                    "type": "TextBlock",
+                    "text": f"{i + 1}. {title}",
+                    "weight": "Bolder",
                 },
-            }
-        )
+                {
+                    "type": "TextBlock",
+                    "text": f"{start or '?'} - {end or '?'} @ {location or '?'}",
+                    "isSubtle": True,
+                    "spacing": "None",
+                },
+            ],
+        }
+        actions[i] = {
+            "type": "Action.Submit",
+            "title": f"Explain #{i + 1}",
+            "data": {
+                "action": "explainSession",
+                "sessionTitle": title,
+                "start": start,
+                "end": end,
+                "room": location,
+            },
+        }
     return {
         "type": "AdaptiveCard",
         "version": "1.5",
-        "body": [
-            {
-                "type": "TextBlock",
-                "text": "Event Recommendations",
-                "weight": "Bolder",
-                "size": "Medium",
-            }
-        ]
-        + body,
+        "body": body,
         "actions": actions,
         "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
     }
@@ -502,7 +1057,8 @@ def main() -> None:
             out_dir.mkdir(parents=True, exist_ok=True)
             fname = args.output or f"itinerary_{'_'.join(interests[:3])}.md"
             path = out_dir / fname
-            path.write_text(md)
+            with open(path, "wb", buffering=1 << 16) as f:
+                f.write(md.encode("utf-8"))
             export_payload = {"saved": str(path), "sessionCount": len(rec["sessions"])}
         else:
             export_payload = {"markdown": md, "sessionCount": len(rec["sessions"])}
@@ -521,9 +1077,88 @@ def main() -> None:
         def _serve_with_telemetry(
             manifest: Dict[str, Any], port: int, default_card: bool
         ):
-            storage_file = manifest.get("profile", {}).get("storage_file")
+            # Telemetry's ID generator, resolved once instead of per request
+            _gen_cid = getattr(t, "generate_correlation_id", None) if t else None
+            # Hot manifest/environment lookups, resolved once into a frozen
+            # slotted config: handlers read attributes instead of walking
+            # dicts per request
+            _feat_export = manifest.get("features", {}).get("export", {})
+            _export_dir = (
+                pathlib.Path(_feat_export.get("output_dir", "exports"))
+                if _feat_export.get("enabled")
+                else None
+            )
+            if _export_dir is not None:
+                _export_dir.mkdir(parents=True, exist_ok=True)
+            _api_token = os.getenv("API_TOKEN")
+            cfg = _ServeConfig(
+                default_top=manifest["recommend"]["max_sessions_default"],
+                storage_file=manifest.get("profile", {}).get("storage_file"),
+                export_dir=_export_dir,
+                expected_auth=(
+                    f"Bearer {_api_token}".encode() if _api_token else None
+                ),
+            )
+
+            # Build the scoring structures once at startup so the first
+            # request doesn't pay the one-time O(N x tags) transform
+            _startup_sessions = get_sessions(manifest)
+            if _startup_sessions:
+                if np is not None:
+                    _, _m, _p, _ = _build_session_matrix(_startup_sessions)
+                    if manifest.get("features", {}).get("batchScoring"):
+                        # Coalesce concurrent request matvecs into one GEMM
+                        _BATCH_SCORER.enable(_m)
+                    if manifest.get("features", {}).get("numbaScoring"):
+                        kernel = _load_numba_kernel()
+                        if kernel is not None:
+                            # Pay JIT compilation now, not on the first request
+                            kernel(
+                                _m, np.zeros(0, dtype=np.int64), _p,
+                                1.0, 1.0, 1.0, 0,
+                            )
+                _session_tag_sets(_startup_sessions)
+                _session_title_index(_startup_sessions)
+
+            # Graph clients are constructed once and shared across requests:
+            # GraphAuthClient caches its token until expiry, so per-request
+            # construction paid a full OAuth round-trip that the memo skips.
+            _graph_lock = threading.Lock()
+            _graph_cache: Dict[str, Any] = {}
+
+            def _graph_service():
+                """Return (service, validation_errors), building at most once."""
+                with _graph_lock:
+                    svc = _graph_cache.get("service")
+                    if svc is not None:
+                        return svc, None
+                    settings = Settings()
+                    if not settings.validate_graph_ready():
+                        return None, settings.get_validation_errors()
+                    svc = GraphEventService(GraphAuthClient(settings), settings)
+                    _graph_cache["service"] = svc
+                    return svc, None
+
+            if GRAPH_AVAILABLE:
+                # Pre-warm the OAuth token off the request path so the first
+                # /recommend-graph call doesn't pay the auth round-trip
+                def _warm_graph() -> None:
+                    try:
+                        svc, _ = _graph_service()
+                        if svc is not None:
+                            svc.auth_client.get_access_token()
+                    except Exception:
+                        pass  # surfaced properly on the first real request
+
+                ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="graph-warm"
+                ).submit(_warm_graph)
 
             class Handler(BaseHTTPRequestHandler):
+                # HTTP/1.1 enables chunked transfer and connection reuse;
+                # every response sets Content-Length or Transfer-Encoding
+                protocol_version = "HTTP/1.1"
+
                 def _get_correlation_id(self) -> str:
                     """Extract or generate a correlation ID for the current request."""
                     # W3C traceparent: 00-<trace-id>-<span-id>-<flags>
@@ -538,13 +1173,13 @@ def main() -> None:
                     cid = self.headers.get("X-Correlation-ID")
                     if cid:
                         return cid
-                    if t:
+                    if _gen_cid is not None:
                         try:
-                            return t.generate_correlation_id()  # type: ignore[attr-defined]
+                            return _gen_cid()
                         except Exception:
                             pass
-                    import uuid
-                    return str(uuid.uuid4())
+                    # 32 hex chars, W3C trace-id shaped, cheaper than uuid4
+                    return secrets.token_hex(16)
 
                 def _send(
                     self,
@@ -556,216 +1191,279 @@ def main() -> None:
                 ):
                     if correlation_id is None:
                         correlation_id = self._get_correlation_id()
-                    body = json.dumps(payload).encode()
+                    body = _dumps(payload)
+                    etag = None
+                    if code == 200 and action in _CACHEABLE_ACTIONS:
+                        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+                        if self.headers.get("If-None-Match") == etag:
+                            # Client already holds this exact payload
+                            code = 304
                     self.send_response(code)
-                    self.send_header("Content-Type", "application/json")
-                    self.send_header("Content-Length", str(len(body)))
+                    if etag is not None:
+                        self.send_header("ETag", etag)
+                        # Token-protected payloads must not land in shared
+                        # caches; only unauthenticated responses are public
+                        scope = (
+                            "private" if cfg.expected_auth is not None else "public"
+                        )
+                        self.send_header("Cache-Control", f"{scope}, max-age=60")
+                    self.send_header("Content-Type", "application/json; charset=utf-8")
                     # CORS for webchat
                     self.send_header("Access-Control-Allow-Origin", "*")
                     # Expose correlation header to browser clients
                     self.send_header("Access-Control-Expose-Headers", "X-Correlation-ID")
                     # Include correlation ID in responses
                     self.send_header("X-Correlation-ID", correlation_id)
-                    self.end_headers()
-                    self.wfile.write(body)
+                    if code == 304:
+                        self.end_headers()
+                    elif len(body) > _CHUNK_THRESHOLD:
+                        # Large payloads stream in fixed-size chunks so the
+                        # first bytes hit the wire while the rest is queued,
+                        # instead of buffering one oversized send
+                        self.send_header("Transfer-Encoding", "chunked")
+                        self.end_headers()
+                        view = memoryview(body)
+                        for off in range(0, len(body), _CHUNK_SIZE):
+                            chunk = view[off:off + _CHUNK_SIZE]
+                            self.wfile.write(b"%X\r\n" % len(chunk))
+                            self.wfile.write(chunk)
+                            self.wfile.write(b"\r\n")
+                        self.wfile.write(b"0\r\n\r\n")
+                    else:
+                        self.send_header("Content-Length", str(len(body)))
+                        self.end_headers()
+                        self.wfile.write(body)
                     if t and action:
                         t.log(
                             action,
                             payload,
                             start_ts,
-                            success=(code == 200 and "error" not in payload),
+                            success=(code in (200, 304) and "error" not in payload),
                             error=payload.get("error"),
                             correlation_id=correlation_id,
                         )
 
                 def do_GET(self):  # noqa: N802
+                    # One clock read per request, reused by every branch
+                    now = time.time()
                     correlation_id = self._get_correlation_id()
                     parsed = urllib.parse.urlparse(self.path)
                     qs = urllib.parse.parse_qs(parsed.query)
                     path = parsed.path
-                    # Optional auth token
-                    token_required = bool(os.getenv("API_TOKEN"))
-                    if token_required:
+                    # Optional auth token (constant-time compare)
+                    if cfg.expected_auth is not None:
                         auth_header = self.headers.get("Authorization", "")
-                        expected = f"Bearer {os.getenv('API_TOKEN')}"
-                        if auth_header != expected:
+                        if not hmac.compare_digest(
+                            auth_header.encode(), cfg.expected_auth
+                        ):
                             self._send(
                                 401,
                                 {"error": "unauthorized"},
-                                time.time(),
+                                now,
                                 "unauthorized",
                                 correlation_id,
                             )
                             return
-                    if path == "/health":
-                        self._send(200, {"status": "ok"}, time.time(), "health", correlation_id)
+                    # Dict dispatch: one hash lookup instead of a chain of
+                    # string comparisons that grows with the route count
+                    route = self._ROUTES.get(path)
+                    if route is None:
+                        self._send(404, {"error": "not found"}, now, "unknown", correlation_id)
+                        return
+                    route(self, qs, now, correlation_id)
+
+                def _route_health(self, qs, now, correlation_id):
+                    self._send(200, {"status": "ok"}, now, "health", correlation_id)
+
+                def _route_recommend(self, qs, now, correlation_id):
+                    start = now
+                    interests_raw = qs.get("interests", [""])[0]
+                    profile_load = qs.get("profileLoad", [None])[0]
+                    top = qs.get("top", [None])[0]
+                    card_flag = qs.get("card", [None])[0]
+                    interests: List[str] = []
+                    if profile_load and cfg.storage_file:
+                        interests = load_profile(cfg.storage_file, profile_load)
+                    if not interests and interests_raw:
+                        interests = _normalize_interests(interests_raw)
+                    if not interests:
+                        self._send(
+                            400,
+                            {"error": "no interests provided"},
+                            start,
+                            "recommend",
+                            correlation_id,
+                        )
+                        return
+                    top_n = int(top) if top else cfg.default_top
+                    result = recommend(manifest, interests, top_n)
+                    if default_card or card_flag == "1":
+                        result["adaptiveCard"] = _build_adaptive_card(
+                            result["sessions"]
+                        )
+                    self._send(200, result, start, "recommend", correlation_id)
+
+                def _route_explain(self, qs, now, correlation_id):
+                    start = now
+                    session_title = qs.get("session", [""])[0]
+                    interests_raw = qs.get("interests", [""])[0]
+                    profile_load = qs.get("profileLoad", [None])[0]
+                    interests: List[str] = []
+                    if profile_load and cfg.storage_file:
+                        interests = load_profile(cfg.storage_file, profile_load)
+                    if not interests and interests_raw:
+                        interests = _normalize_interests(interests_raw)
+                    if not session_title:
+                        self._send(
+                            400, {"error": "session required"}, start, "explain"
+                        )
                         return
-                    if path == "/recommend":
-                        start = time.time()
-                        interests_raw = qs.get("interests", [""])[0]
-                        profile_load = qs.get("profileLoad", [None])[0]
-                        top = qs.get("top", [None])[0]
-                        card_flag = qs.get("card", [None])[0]
-                        interests: List[str] = []
-                        if profile_load and storage_file:
-                            interests = load_profile(storage_file, profile_load)
-                        if not interests and interests_raw:
-                            interests = _normalize_interests(interests_raw)
-                        if not interests:
+                    result = explain(manifest, session_title, interests)
+                    self._send(200, result, start, "explain", correlation_id)
+
+                def _route_recommend_graph(self, qs, now, correlation_id):
+                    if not GRAPH_AVAILABLE:
+                        self._send(
+                            503,
+                            {"error": "Graph API support not available"},
+                            now,
+                            "recommend_graph",
+                            correlation_id,
+                        )
+                        return
+                    start = now
+                    interests_raw = qs.get("interests", [""])[0]
+                    user_id = qs.get("userId", [None])[0]
+                    top = qs.get("top", [None])[0]
+                    card_flag = qs.get("card", [None])[0]
+                    interests: List[str] = []
+                    if interests_raw:
+                        interests = _normalize_interests(interests_raw)
+                    if not interests:
+                        self._send(
+                            400,
+                            {"error": "no interests provided"},
+                            start,
+                            "recommend_graph",
+                            correlation_id,
+                        )
+                        return
+                    try:
+                        graph_service, errors = _graph_service()
+                        if graph_service is None:
                             self._send(
-                                400,
-                                {"error": "no interests provided"},
+                                502,
+                                {
+                                    "error": "Graph credentials not configured",
+                                    "details": ", ".join(errors),
+                                },
                                 start,
-                                "recommend",
+                                "recommend_graph",
                                 correlation_id,
                             )
                             return
-                        top_n = (
-                            int(top)
-                            if top
-                            else manifest["recommend"]["max_sessions_default"]
+                        top_n = int(top) if top else cfg.default_top
+                        result = recommend_from_graph(
+                            graph_service, interests, top_n
                         )
-                        result = recommend(manifest, interests, top_n)
+                        if user_id:
+                            result["userId"] = user_id
                         if default_card or card_flag == "1":
                             result["adaptiveCard"] = _build_adaptive_card(
                                 result["sessions"]
                             )
-                        self._send(200, result, start, "recommend", correlation_id)
+                        self._send(200, result, start, "recommend_graph", correlation_id)
                         return
-                    if path == "/explain":
-                        start = time.time()
-                        session_title = qs.get("session", [""])[0]
-                        interests_raw = qs.get("interests", [""])[0]
-                        profile_load = qs.get("profileLoad", [None])[0]
-                        interests: List[str] = []
-                        if profile_load and storage_file:
-                            interests = load_profile(storage_file, profile_load)
-                        if not interests and interests_raw:
-                            interests = _normalize_interests(interests_raw)
-                        if not session_title:
-                            self._send(
-                                400, {"error": "session required"}, start, "explain"
-                            )
-                            return
-                        result = explain(manifest, session_title, interests)
-                        self._send(200, result, start, "explain", correlation_id)
+                    except (GraphAuthError, GraphServiceError) as e:
+                        self._send(
+                            502,
+                            {"error": f"Graph API error: {str(e)}"},
+                            start,
+                            "recommend_graph",
+                            correlation_id,
+                        )
                         return
-                    if path == "/recommend-graph":
-                        if not GRAPH_AVAILABLE:
-                            self._send(
-                                503,
-                                {"error": "Graph API support not available"},
-                                time.time(),
-                                "recommend_graph",
-                                correlation_id,
-                            )
-                            return
-                        start = time.time()
-                        interests_raw = qs.get("interests", [""])[0]
-                        user_id = qs.get("userId", [None])[0]
-                        top = qs.get("top", [None])[0]
-                        card_flag = qs.get("card", [None])[0]
-                        interests: List[str] = []
-                        if interests_raw:
-                            interests = _normalize_interests(interests_raw)
-                        if not interests:
-                            self._send(
-                                400,
-                                {"error": "no interests provided"},
-                                start,
-                                "recommend_graph",
-                                correlation_id,
-                            )
-                            return
-                        try:
-                            settings = Settings()
-                            if not settings.validate_graph_ready():
-                                errors = settings.get_validation_errors()
-                                self._send(
-                                    502,
-                                    {
-                                        "error": "Graph credentials not configured",
-                                        "details": ", ".join(errors),
-                                    },
-                                    start,
-                                    "recommend_graph",
-                                    correlation_id,
-                                )
-                                return
-                            auth_client = GraphAuthClient(settings)
-                            graph_service = GraphEventService(auth_client, settings)
-                            top_n = (
-                                int(top)
-                                if top
-                                else manifest["recommend"]["max_sessions_default"]
-                            )
-                            result = recommend_from_graph(
-                                graph_service, interests, top_n
-                            )
-                            if user_id:
-                                result["userId"] = user_id
-                            if default_card or card_flag == "1":
-                                result["adaptiveCard"] = _build_adaptive_card(
-                                    result["sessions"]
-                                )
-                            self._send(200, result, start, "recommend_graph", correlation_id)
-                            return
-                        except (GraphAuthError, GraphServiceError) as e:
-                            self._send(
-                                502,
-                                {"error": f"Graph API error: {str(e)}"},
-                                start,
-                                "recommend_graph",
-                                correlation_id,
-                            )
-                            return
-                        except ValueError as e:
-                            self._send(
-                                400,
-                                {"error": str(e)},
+                    except ValueError as e:
+                        self._send(
+                            400,
+                            {"error": str(e)},
+                            start,
+                            "recommend_graph",
+                            correlation_id,
+                        )
+                        return
+
+                def _route_export(self, qs, now, correlation_id):
+                    start = now
+                    interests_raw = qs.get("interests", [""])[0]
+                    profile_load = qs.get("profileLoad", [None])[0]
+                    interests: List[str] = []
+                    if profile_load and cfg.storage_file:
+                        interests = load_profile(cfg.storage_file, profile_load)
+                    if not interests and interests_raw:
+                        interests = _normalize_interests(interests_raw)
+                    if not interests:
+                        self._send(
+                            400, {"error": "no interests provided"}, start, "export"
+                        )
+                        return
+                    rec = _recommend_cached(manifest, interests, cfg.default_top)
+                    md, md_bytes = _itinerary_markdown_cached(interests, rec)
+                    if qs.get("format", [None])[0] == "md":
+                        # The markdown is already encoded; streaming it
+                        # raw skips the JSON string-escape pass entirely
+                        saved = None
+                        if cfg.export_dir is not None:
+                            saved = cfg.export_dir / _itinerary_filename(interests)
+                            _EXPORT_WRITER.submit(saved, md_bytes)
+                        self.send_response(200)
+                        self.send_header("Content-Type", "text/markdown; charset=utf-8")
+                        self.send_header("Content-Length", str(len(md_bytes)))
+                        self.send_header("Access-Control-Allow-Origin", "*")
+                        self.send_header(
+                            "Access-Control-Expose-Headers", "X-Correlation-ID"
+                        )
+                        self.send_header("X-Correlation-ID", correlation_id)
+                        if saved is not None:
+                            self.send_header("X-Export-Path", str(saved))
+                        self.end_headers()
+                        self.wfile.write(md_bytes)
+                        if t:
+                            t.log(
+                                "export",
+                                {"sessionCount": len(rec["sessions"])},
                                 start,
-                                "recommend_graph",
-                                correlation_id,
-                            )
-                            return
-                    if path == "/export":
-                        start = time.time()
-                        interests_raw = qs.get("interests", [""])[0]
-                        profile_load = qs.get("profileLoad", [None])[0]
-                        interests: List[str] = []
-                        if profile_load and storage_file:
-                            interests = load_profile(storage_file, profile_load)
-                        if not interests and interests_raw:
-                            interests = _normalize_interests(interests_raw)
-                        if not interests:
-                            self._send(
-                                400, {"error": "no interests provided"}, start, "export"
-                            )
-                            return
-                        top_n = manifest["recommend"]["max_sessions_default"]
-                        rec = recommend(manifest, interests, top_n)
-                        md = _build_itinerary_markdown(interests, rec)
-                        response = {
-                            "markdown": md,
-                            "sessionCount": len(rec["sessions"]),
-                        }
-                        feat_export = manifest.get("features", {}).get("export", {})
-                        if feat_export.get("enabled"):
-                            out_dir = pathlib.Path(
-                                feat_export.get("output_dir", "exports")
+                                success=True,
+                                correlation_id=correlation_id,
                             )
-                            out_dir.mkdir(parents=True, exist_ok=True)
-                            path = out_dir / f"itinerary_{'_'.join(interests[:3])}.md"
-                            path.write_text(md)
-                            response["saved"] = str(path)
-                        self._send(200, response, start, "export", correlation_id)
                         return
-                    self._send(404, {"error": "not found"}, time.time(), "unknown", correlation_id)
+                    response = {
+                        "markdown": md,
+                        "sessionCount": len(rec["sessions"]),
+                    }
+                    if cfg.export_dir is not None:
+                        path = cfg.export_dir / _itinerary_filename(interests)
+                        # The write happens off the request path; the
+                        # markdown is already in the response body
+                        _EXPORT_WRITER.submit(path, md_bytes)
+                        response["saved"] = str(path)
+                    self._send(200, response, start, "export", correlation_id)
+
+                # Plain functions here, so dispatch calls route(self, ...)
+                _ROUTES = {
+                    "/health": _route_health,
+                    "/recommend": _route_recommend,
+                    "/explain": _route_explain,
+                    "/recommend-graph": _route_recommend_graph,
+                    "/export": _route_export,
+                }
 
                 def log_message(self, fmt, *a):
                     return
 
-            server = HTTPServer(("0.0.0.0", port), Handler)
+            # Threaded server: a slow Graph round-trip on one connection no
+            # longer stalls health checks and every other request
+            server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
             print(
                 f"[serve] listening on port {port} (endpoints: /recommend /recommend-graph /explain /health /export)"
             )
@@ -773,6 +1471,7 @@ def main() -> None:
                 server.serve_forever()
             except KeyboardInterrupt:
                 print("[serve] shutting down")
+                _EXPORT_WRITER.drain()
                 server.server_close()
 
         _serve_with_telemetry(manifest, args.port, getattr(args, "card", False))
@@ -22,13 +22,23 @@ Usage:
     result = await agent.run("recommend sessions about agents and AI")
 """
 
+from __future__ import annotations
+
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 import json
 from datetime import datetime
 
-# Import unified adapter
-from adapters.foundry_adapter import FoundryAdapter
+# Import unified adapter (and its lazy Agent Framework importer, so this
+# module stays importable when the SDK is not installed)
+from adapters.foundry_adapter import FoundryAdapter, _lazy_import_agent_framework
+from core import recommend, explain, export_itinerary
+
+if TYPE_CHECKING:
+    # Type-only imports; the runtime path goes through the lazy importer
+    from agent_framework import Agent, RunContext
+    from agent_framework_azure_ai import AzureAIAgent
 
 logger = logging.getLogger(__name__)
 
@@ -73,8 +83,12 @@ class EventKitAgentFramework(FoundryAdapter):
 
         logger.info(f"EventKit Agent Framework initialized with model: {model_deployment}")
 
-    def _create_agent(self) -> Agent:
+    def _create_agent(self) -> Optional[Agent]:
         """Create Agent Framework agent with EventKit tools."""
+        framework = _lazy_import_agent_framework()
+        if framework is None:
+            return None
+        AzureAIAgent, _, Tool, _, _ = framework
 
         # Define tools for the agent
         tools = [
@@ -252,6 +266,39 @@ class EventKitAgentFramework(FoundryAdapter):
                 "error": str(e)
             }
 
+    async def run_tools(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute independent tool calls concurrently.
+
+        When the model requests several tools in one turn (e.g. recommend
+        plus export), dispatching them together takes the max of the tool
+        latencies rather than the sum. Each synchronous tool function runs
+        in a worker thread so the event loop keeps streaming.
+
+        Args:
+            calls: (tool_name, keyword arguments) pairs
+
+        Returns:
+            Tool result dicts in call order
+
+        Raises:
+            KeyError: If a tool name is not registered
+        """
+        tool_funcs = {
+            "recommend_sessions": self._tool_recommend_sessions,
+            "explain_session": self._tool_explain_session,
+            "export_itinerary": self._tool_export_itinerary,
+        }
+        return await asyncio.gather(
+            *[
+                asyncio.to_thread(tool_funcs[name], **params)
+                for name, params in calls
+            ]
+        )
+
     async def run(self, user_message: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Run the agent with a user message.
@@ -264,6 +311,7 @@ class EventKitAgentFramework(FoundryAdapter):
             Agent's response text
         """
         try:
+            _, _, _, RunContext, _ = _lazy_import_agent_framework()
             # Create run context
             run_context = RunContext(
                 user_id=context.get("user_id", "default") if context else "default",
@@ -295,6 +343,7 @@ class EventKitAgentFramework(FoundryAdapter):
             Response chunks as they're generated
         """
         try:
+            _, _, _, RunContext, _ = _lazy_import_agent_framework()
             run_context = RunContext(
                 user_id=context.get("user_id", "default") if context else "default",
                 conversation_id=context.get("conversation_id", "default") if context else "default",
@@ -15,11 +15,33 @@ Usage:
     })
 """
 
+import functools
 import json
 import logging
+import os
+from collections import OrderedDict
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+# orjson parses and serializes JSON in C, several times faster than the
+# stdlib on manifest-sized documents (optional dependency). Both helpers
+# work on bytes so callers read/write files in binary mode either way.
+try:
+    import orjson
+
+    def _loads(buf: bytes) -> Any:
+        return orjson.loads(buf)
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(buf: bytes) -> Any:
+        return json.loads(buf)
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 # Import core Event Kit functionality
 try:
     from core import recommend, explain, recommend_from_graph
@@ -54,6 +76,62 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# Fields the formatters read off every session, with their defaults.
+# Sessions are normalized once at parse time so the hot formatting path
+# can index these directly instead of calling .get per field per call.
+_SESSION_FIELDS = frozenset(
+    ("id", "title", "category", "description", "keywords", "popularity")
+)
+# Shared empty singletons for absent-field defaults; never mutated, so
+# the common miss path stops allocating a fresh empty container per call
+_EMPTY: tuple = ()
+_EMPTY_DICT: Dict[str, Any] = {}
+
+_SESSION_DEFAULTS = {
+    "title": "Untitled",
+    "category": "General",
+    "description": "",
+    "keywords": (),
+    "popularity": 0,
+}
+
+
+def _normalize_sessions(sessions: List[Dict[str, Any]]) -> None:
+    """Fill missing formatter fields in place, once per manifest parse."""
+    for i, session in enumerate(sessions):
+        session.setdefault("id", f"session-{i}")
+        session.setdefault("title", "Untitled")
+        session.setdefault("category", "General")
+        session.setdefault("description", "")
+        session.setdefault("keywords", [])
+        session.setdefault("popularity", 0)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_manifest_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a manifest once per (path, mtime, size) triple.
+
+    Agents constructed per request share the parsed dict instead of each
+    paying disk IO plus a JSON parse; an edited manifest changes the stat
+    signature and misses the cache. Handlers never mutate the manifest,
+    so the shared dict is returned directly.
+    """
+    with open(path_str, 'rb') as f:
+        manifest = _loads(f.read())
+    _normalize_sessions(manifest.get("sessions", []))
+    return manifest
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_interests(s: str) -> tuple:
+    """Split a comma-separated interests string, cached per input.
+
+    Teams/Copilot sessions repeat the same interests string across tool
+    calls; the tuple return keeps the cached value hashable and immutable.
+    """
+    return tuple(i.strip() for i in s.split(",") if i.strip())
+
+
 class EventKitAgent:
     """
     Azure AI Projects SDK adapter for Event Kit Agent.
@@ -66,7 +144,30 @@ class EventKitAgent:
         telemetry: Telemetry client for logging
         manifest: Loaded session manifest data
     """
-    
+
+    # No per-instance __dict__: attribute access is cheaper and each
+    # agent is lighter, which matters when one is built per request
+    __slots__ = (
+        "settings",
+        "telemetry",
+        "manifest_path",
+        "manifest",
+        "_recommend_cache",
+        "_core_ready",
+        "_profiles",
+        "_profile_file",
+    )
+
+    # Tool name -> handler method name. Class-level and immutable in
+    # practice; dispatch resolves the bound method with getattr instead
+    # of building a per-instance dict of bound handlers in __init__.
+    tool_handlers = {
+        "recommend_sessions": "_handle_recommend",
+        "explain_session": "_handle_explain",
+        "export_itinerary": "_handle_export",
+    }
+
+
     def __init__(
         self,
         settings: Optional[Any] = None,
@@ -87,27 +188,65 @@ class EventKitAgent:
         
         # Load manifest
         self.manifest = self._load_manifest()
-        
-        # Tool call handlers
-        self.tool_handlers = {
-            "recommend_sessions": self._handle_recommend,
-            "explain_session": self._handle_explain,
-            "export_itinerary": self._handle_export,
-        }
-        
+
+        # Bounded LRU of recommend() results. The manifest is fixed for
+        # the life of the instance, so (interests, top) fully keys a
+        # query; repeated requests skip the scoring pass entirely.
+        self._recommend_cache: OrderedDict = OrderedDict()
+
+        # The core bindings never change after import; check once here so
+        # handlers test one slot attribute instead of comparing module
+        # globals against None on every call. The calls themselves still
+        # resolve the globals, so patched bindings keep taking effect.
+        self._core_ready = recommend is not None
+
+        # Profiles file contents, read once on first save (None = not
+        # yet loaded); later saves merge in memory and rewrite. The file
+        # path is resolved lazily alongside it, since Path.home() costs
+        # an environment/pwd lookup per call.
+        self._profiles: Optional[Dict[str, Any]] = None
+        self._profile_file: Optional[Path] = None
+
         logger.info("EventKitAgent initialized")
     
+    _RECOMMEND_CACHE_MAX = 256
+
+    def _recommend_cached(self, interests: tuple, top: int) -> Dict[str, Any]:
+        """Run recommend() against the manifest, memoizing per query.
+
+        Callers treat the returned dict as read-only; the cache hands the
+        same object back for identical (interests, top) pairs.
+        """
+        key = (interests, top)
+        cache = self._recommend_cache
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+            return hit
+        result = recommend(
+            manifest=self.manifest,
+            interests=list(interests),
+            top=top
+        )
+        cache[key] = result
+        if len(cache) > self._RECOMMEND_CACHE_MAX:
+            cache.popitem(last=False)
+        return result
+
     def _load_manifest(self) -> Dict[str, Any]:
         """Load the session manifest from agent.json."""
         try:
-            with open(self.manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
+            st = self.manifest_path.stat()
+            manifest = _load_manifest_cached(
+                str(self.manifest_path.resolve()), st.st_mtime_ns, st.st_size
+            )
             logger.info(f"Loaded manifest with {len(manifest.get('sessions', []))} sessions")
             return manifest
         except FileNotFoundError:
             logger.error(f"Manifest file not found: {self.manifest_path}")
             return {"sessions": []}
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError
             logger.error(f"Failed to parse manifest: {e}")
             return {"sessions": []}
     
@@ -133,10 +272,12 @@ class EventKitAgent:
         else:
             logger.info(f"Processing tool call: {tool_name}")
         
-        # Get handler
-        handler = self.tool_handlers.get(tool_name)
-        if not handler:
+        # Get handler (bound-method lookup via getattr; the mapping only
+        # validates the name and supplies the attribute to resolve)
+        method_name = self.tool_handlers.get(tool_name)
+        if method_name is None:
             raise InvalidInputError(f"Unknown tool: {tool_name}")
+        handler = getattr(self, method_name)
         
         try:
             # Execute handler
@@ -149,7 +290,7 @@ class EventKitAgent:
                     correlation_id=correlation_id,
                     interests=parameters.get("interests", ""),
                     duration_ms=0,  # Actual duration would be measured in production
-                    sessions_returned=len(result.get("sessions", []))
+                    sessions_returned=len(result.get("sessions") or _EMPTY)
                 )
             
             return result
@@ -182,7 +323,7 @@ class EventKitAgent:
             raise InvalidInputError("'interests' parameter is required")
         
         # Parse interests
-        interests_list = [i.strip() for i in interests.split(",") if i.strip()]
+        interests_list = list(_parse_interests(interests))
         
         if not interests_list:
             raise InvalidInputError("At least one interest is required")
@@ -190,7 +331,7 @@ class EventKitAgent:
         # Choose recommendation source
         if use_graph and self.settings.graph_enabled:
             # Use Graph-based recommendations
-            if recommend_from_graph is None:
+            if not self._core_ready:
                 raise EventKitError("Graph recommendations not available")
             
             result = recommend_from_graph(
@@ -200,15 +341,11 @@ class EventKitAgent:
             )
         else:
             # Use manifest-based recommendations
-            if recommend is None:
+            if not self._core_ready:
                 raise EventKitError("Recommend function not available")
             
-            result = recommend(
-                manifest=self.manifest,
-                interests=interests_list,
-                top=top
-            )
-        
+            result = self._recommend_cached(tuple(interests_list), top)
+
         # Format for Teams/Copilot
         formatted_result = self._format_recommendation_result(result)
         
@@ -236,9 +373,9 @@ class EventKitAgent:
             raise InvalidInputError("'interests' parameter is required")
         
         # Parse interests
-        interests_list = [i.strip() for i in interests.split(",") if i.strip()]
+        interests_list = list(_parse_interests(interests))
         
-        if explain is None:
+        if not self._core_ready:
             raise EventKitError("Explain function not available")
         
         # Get explanation
@@ -248,15 +385,15 @@ class EventKitAgent:
             interests=interests_list
         )
         
-        # Format for Teams/Copilot
+        # Format for Teams/Copilot (core explain returns title/score/matched_tags)
         formatted_result = {
-            "session": session_title,
+            "session": result.get("title", session_title),
             "explanation": result.get("explanation", ""),
-            "matched_keywords": result.get("matched_keywords", []),
-            "relevance_score": result.get("relevance_score", 0.0),
-            "markdown": self._format_explanation_markdown(result)
+            "matched_keywords": result.get("matched_tags", []),
+            "relevance_score": result.get("score", 0.0),
         }
-        
+        formatted_result["markdown"] = self._format_explanation_markdown(formatted_result)
+
         return formatted_result
     
     def _handle_export(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -278,17 +415,14 @@ class EventKitAgent:
             raise InvalidInputError("'interests' parameter is required")
         
         # Parse interests
-        interests_list = [i.strip() for i in interests.split(",") if i.strip()]
+        interests_list = list(_parse_interests(interests))
         
         # Get recommendations for export
-        if recommend is None:
+        if not self._core_ready:
             raise EventKitError("Recommend function not available")
         
-        recommendations = recommend(
-            manifest=self.manifest,
-            interests=interests_list,
-            top=10  # Export more sessions
-        )
+        # Export more sessions than the default recommend view
+        recommendations = self._recommend_cached(tuple(interests_list), 10)
         
         # Generate markdown
         markdown = self._generate_itinerary_markdown(recommendations, interests_list)
@@ -307,21 +441,28 @@ class EventKitAgent:
     
     def _format_recommendation_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Format recommendation result for Teams/Copilot display."""
-        sessions = result.get("sessions", [])
-        scoring = result.get("scoring", [])
-        
+        sessions = result.get("sessions") or _EMPTY
+        scoring = result.get("scoring") or _EMPTY
+        if len(scoring) < len(sessions):
+            # Pad once so the loop zips without per-row bounds checks
+            scoring = tuple(scoring) + (_EMPTY_DICT,) * (
+                len(sessions) - len(scoring)
+            )
+
         # Format sessions with enhanced metadata
         formatted_sessions = []
-        for i, session in enumerate(sessions):
-            score_info = scoring[i] if i < len(scoring) else {}
-            
+        for i, (session, score_info) in enumerate(zip(sessions, scoring)):
+            if not _SESSION_FIELDS <= session.keys():
+                # Graph-sourced sessions bypass manifest normalization;
+                # one set comparison replaces six per-field defaults
+                session = {**_SESSION_DEFAULTS, "id": f"session-{i}", **session}
             formatted_session = {
-                "id": session.get("id", f"session-{i}"),
-                "title": session.get("title", "Untitled"),
-                "category": session.get("category", "General"),
-                "description": session.get("description", ""),
-                "keywords": session.get("keywords", []),
-                "popularity": session.get("popularity", 0),
+                "id": session["id"],
+                "title": session["title"],
+                "category": session["category"],
+                "description": session["description"],
+                "keywords": session["keywords"],
+                "popularity": session["popularity"],
                 "score": score_info.get("score", 0),
                 "matched_interests": score_info.get("matched_interests", []),
                 "confidence": score_info.get("confidence_level", 0)
@@ -338,20 +479,22 @@ class EventKitAgent:
     def _format_recommendations_markdown(self, sessions: List[Dict[str, Any]]) -> str:
         """Generate markdown representation of recommendations."""
         lines = ["# Recommended Sessions\n"]
-        
+
         for i, session in enumerate(sessions, 1):
-            lines.append(f"## {i}. {session['title']}")
-            lines.append(f"**Category**: {session['category']}")
-            lines.append(f"**Score**: {session['score']:.2f}")
-            
-            if session.get('matched_interests'):
-                lines.append(f"**Matched Interests**: {', '.join(session['matched_interests'])}")
-            
-            if session.get('description'):
-                lines.append(f"\n{session['description']}")
-            
-            lines.append("")  # Empty line between sessions
-        
+            matched = session.get('matched_interests')
+            matched_block = (
+                f"\n**Matched Interests**: {', '.join(matched)}" if matched else ""
+            )
+            description = session.get('description')
+            desc_block = f"\n\n{description}" if description else ""
+            # One append per session instead of one per output line
+            lines.append(
+                f"## {i}. {session['title']}\n"
+                f"**Category**: {session['category']}\n"
+                f"**Score**: {session['score']:.2f}"
+                f"{matched_block}{desc_block}\n"
+            )
+
         return "\n".join(lines)
     
     def _format_explanation_markdown(self, result: Dict[str, Any]) -> str:
@@ -382,65 +525,92 @@ class EventKitAgent:
         interests: List[str]
     ) -> str:
         """Generate complete itinerary in Markdown format."""
-        lines = [
-            "# My Personalized Event Itinerary",
-            "",
-            f"**Interests**: {', '.join(interests)}",
-            f"**Generated**: {self._get_timestamp()}",
-            "",
-            "---",
-            ""
-        ]
-        
-        sessions = recommendations.get("sessions", [])
-        scoring = recommendations.get("scoring", [])
-        
-        for i, session in enumerate(sessions):
-            score_info = scoring[i] if i < len(scoring) else {}
-            
-            lines.append(f"## {i+1}. {session.get('title', 'Untitled')}")
-            lines.append(f"**Category**: {session.get('category', 'General')}")
-            lines.append(f"**Relevance Score**: {score_info.get('score', 0):.2f}")
-            
-            if session.get('description'):
-                lines.append("")
-                lines.append(session['description'])
-            
+        return "\n".join(
+            self._iter_itinerary_markdown(recommendations, interests)
+        )
+
+    def _iter_itinerary_markdown(
+        self,
+        recommendations: Dict[str, Any],
+        interests: List[str]
+    ):
+        """Yield itinerary markdown one block at a time.
+
+        The join in _generate_itinerary_markdown consumes the generator
+        directly, so peak intermediate state is one session block rather
+        than a list of every output line.
+        """
+        yield (
+            "# My Personalized Event Itinerary\n"
+            "\n"
+            f"**Interests**: {', '.join(interests)}\n"
+            f"**Generated**: {self._get_timestamp()}\n"
+            "\n"
+            "---\n"
+        )
+
+        sessions = recommendations.get("sessions") or _EMPTY
+        scoring = recommendations.get("scoring") or _EMPTY
+        if len(scoring) < len(sessions):
+            scoring = tuple(scoring) + (_EMPTY_DICT,) * (
+                len(sessions) - len(scoring)
+            )
+
+        for i, (session, score_info) in enumerate(zip(sessions, scoring)):
+            description = session.get('description')
+            desc_block = f"\n\n{description}" if description else ""
             matched = score_info.get('matched_interests', [])
-            if matched:
-                lines.append("")
-                lines.append(f"**Why this session**: Matches your interests in {', '.join(matched)}")
-            
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-        
+            matched_block = (
+                f"\n\n**Why this session**: Matches your interests in {', '.join(matched)}"
+                if matched else ""
+            )
+            yield (
+                f"## {i+1}. {session.get('title', 'Untitled')}\n"
+                f"**Category**: {session.get('category', 'General')}\n"
+                f"**Relevance Score**: {score_info.get('score', 0):.2f}"
+                f"{desc_block}{matched_block}\n\n---\n"
+            )
+
         conflicts = recommendations.get("conflicts", 0)
         if conflicts > 0:
-            lines.append(f"⚠️ **Note**: {conflicts} scheduling conflicts detected")
-        
-        return "\n".join(lines)
+            yield f"⚠️ **Note**: {conflicts} scheduling conflicts detected"
     
     def _save_profile(self, profile_name: str, interests: List[str]) -> bool:
         """Save user profile for future use."""
         try:
-            profile_file = Path.home() / ".event_agent_profiles.json"
-            
-            # Load existing profiles
-            profiles = {}
-            if profile_file.exists():
-                with open(profile_file, 'r') as f:
-                    profiles = json.load(f)
-            
+            profile_file = self._profile_file
+            if profile_file is None:
+                profile_file = self._profile_file = (
+                    Path.home() / ".event_agent_profiles.json"
+                )
+
+            # Load existing profiles once; subsequent saves merge into
+            # the in-memory copy instead of re-reading the file
+            profiles = self._profiles
+            if profiles is None:
+                profiles = {}
+                if profile_file.exists():
+                    with open(profile_file, 'rb') as f:
+                        profiles = _loads(f.read())
+                self._profiles = profiles
+
             # Save profile
             profiles[profile_name] = {
                 "interests": interests,
                 "updated": self._get_timestamp()
             }
-            
-            with open(profile_file, 'w') as f:
-                json.dump(profiles, f, indent=2)
-            
+
+            # Compact serialize once, write to a sibling temp file and
+            # publish with os.replace so a crash mid-write can never
+            # leave a truncated profiles file behind
+            data = _dumps_bytes(profiles)
+            tmp_file = profile_file.with_suffix(".json.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, profile_file)
+
             logger.info(f"Saved profile: {profile_name}")
             return True
             
@@ -450,7 +620,6 @@ class EventKitAgent:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_capabilities(self) -> List[Dict[str, Any]]:
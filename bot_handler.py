@@ -12,6 +12,8 @@ Usage:
     response = await handler.on_message_activity(context)
 """
 
+from __future__ import annotations
+
 import logging
 import json
 from typing import Any, Dict, Optional, List
@@ -418,10 +420,11 @@ Need help? Check the documentation at https://github.com/peterswimm/event-agent-
                 )
             )
         
+        titles = ", ".join(f"{s['title'][:25]}..." for s in sessions)
         hero_card = HeroCard(
             title="Session Recommendations",
             subtitle=f"Based on your interests ({len(sessions)} results)",
-            text=f"Relevance: {', '.join([f\"{s['title'][:25]}...\" for s in sessions])}",
+            text=f"Relevance: {titles}",
             buttons=card_actions if HAS_BOT_FRAMEWORK else None
         )
         
@@ -22,11 +22,13 @@ try:
     from agent import recommend as _recommend_impl  # type: ignore
     from agent import explain as _explain_impl  # type: ignore
     from agent import score_session, _count_conflicts  # type: ignore
+    from agent import _build_itinerary_markdown  # type: ignore
 except ImportError:
     # Fallback for package imports
     from .agent import recommend as _recommend_impl  # type: ignore
     from .agent import explain as _explain_impl  # type: ignore
     from .agent import score_session, _count_conflicts  # type: ignore
+    from .agent import _build_itinerary_markdown  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,32 @@ def explain(
     return _explain_impl(manifest, session_title, interests)
 
 
+def export_itinerary(
+    manifest: Dict[str, Any],
+    interests: List[str],
+    profile_name: Optional[str] = None,
+    top: int = 10,
+) -> Dict[str, Any]:
+    """Build a markdown itinerary from top recommendations.
+
+    Args:
+        manifest: Parsed agent manifest containing sessions
+        interests: List of interest strings to match against session tags
+        profile_name: Optional profile name recorded in the result
+        top: Number of sessions to include in the itinerary
+
+    Returns:
+        Dictionary with "markdown", "sessions", and "profile_name" keys.
+    """
+    recommendation = _recommend_impl(manifest, interests, top)
+    markdown = _build_itinerary_markdown(interests, recommendation)
+    return {
+        "markdown": markdown,
+        "sessions": recommendation.get("sessions", []),
+        "profile_name": profile_name,
+    }
+
+
 def recommend_from_graph(
     graph_service: Any,
     interests: List[str],
@@ -0,0 +1,13 @@
+"""Shared exception types for Event Kit.
+
+Adapters and hosts raise these instead of bare exceptions so callers can
+distinguish bad input from internal failures.
+"""
+
+
+class EventKitError(Exception):
+    """Base exception for Event Kit failures (tool execution, backends)."""
+
+
+class InvalidInputError(EventKitError):
+    """Raised when a caller supplies missing or malformed parameters."""
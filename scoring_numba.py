@@ -0,0 +1,41 @@
+"""Numba-accelerated scoring kernel for the recommend hot path.
+
+Optional module: agent.recommend imports it lazily, and only when the
+manifest enables ``features.numbaScoring``. Requires numpy and numba;
+callers fall back to the NumPy or pure-Python scorer when either is
+missing, so nothing here may be imported unconditionally.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def score_all(T, cols, pop, w_i, w_p, w_d, n_unique_interests):
+    """Score every session against the interest columns.
+
+    Args:
+        T: boolean [n_sessions, n_tags] tag-presence matrix
+        cols: int array of interest column ids
+        pop: float32 popularity vector
+        w_i, w_p, w_d: interest / popularity / diversity weights
+        n_unique_interests: number of distinct interests supplied
+
+    Returns:
+        float32 scores array, one entry per session.
+
+    Explicit loops on purpose: numba compiles them to tight native code,
+    avoiding the temporaries a vectorized NumPy expression allocates, and
+    prange spreads the session rows across cores. The first call pays JIT
+    compilation (cached on disk via cache=True); agent.serve warms it.
+    """
+    n = T.shape[0]
+    scores = np.empty(n, dtype=np.float32)
+    diversity = n_unique_interests * 0.01 * w_d
+    for i in prange(n):
+        hits = 0
+        for j in range(cols.shape[0]):
+            if T[i, cols[j]]:
+                hits += 1
+        scores[i] = hits * w_i + pop[i] * w_p + diversity
+    return scores
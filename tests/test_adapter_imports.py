@@ -0,0 +1,18 @@
+"""Import smoke tests for optional-dependency adapter modules.
+
+These modules must stay importable when their optional SDKs are absent;
+the functional test modules skip via importorskip before importing them,
+so a module-level NameError/ImportError would otherwise go unnoticed.
+"""
+
+import importlib
+
+
+def test_agent_framework_adapter_imports():
+    module = importlib.import_module("agent_framework_adapter")
+    assert hasattr(module, "EventKitAgentFramework")
+
+
+def test_agents_sdk_adapter_imports():
+    module = importlib.import_module("agents_sdk_adapter")
+    assert hasattr(module, "EventKitAgent")
@@ -0,0 +1,77 @@
+"""Parity between the NumPy scoring path and the pure-Python fallback.
+
+recommend() takes the vectorized path whenever numpy is importable, so
+without this check CI would only ever exercise whichever path matches
+the environment. Skips when numpy is not installed.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy", reason="vectorized scoring path needs numpy")
+
+import agent
+
+
+def _pure_python_recommend(manifest, interests, top):
+    """Run recommend() with the numpy path disabled."""
+    saved = agent.np
+    agent.np = None
+    try:
+        return agent.recommend(manifest, list(interests), top)
+    finally:
+        agent.np = saved
+
+
+@pytest.mark.parametrize(
+    "interests",
+    [
+        ["agents", "ai safety"],
+        ["evals"],
+        ["agents", "agents", "ai safety"],  # duplicates must not change ranking
+        ["nonexistent topic"],
+    ],
+)
+def test_vectorized_matches_pure_python(interests):
+    manifest = agent.load_manifest()
+    top = 5
+
+    vec = agent.recommend(manifest, list(interests), top)
+    pure = _pure_python_recommend(manifest, interests, top)
+
+    assert [s["title"] for s in vec["sessions"]] == [
+        s["title"] for s in pure["sessions"]
+    ]
+    assert vec["conflicts"] == pure["conflicts"]
+    for v, p in zip(vec["scoring"], pure["scoring"]):
+        assert v["title"] == p["title"]
+        # float32 accumulation vs Python floats
+        assert v["score"] == pytest.approx(p["score"], abs=1e-4)
+        assert v["contributions"]["interest_match"] == pytest.approx(
+            p["contributions"]["interest_match"], abs=1e-4
+        )
+
+
+@pytest.mark.parametrize(
+    "interests",
+    [
+        ["agents", "ai safety"],
+        ["agents", "agents", "ai safety"],  # duplicate columns must not double-count
+    ],
+)
+def test_numba_kernel_matches_numpy_path(interests):
+    pytest.importorskip("numba", reason="kernel path needs numba")
+    manifest = dict(agent.load_manifest())
+    top = 5
+
+    base = agent.recommend(manifest, list(interests), top)
+
+    with_kernel = dict(manifest)
+    with_kernel["features"] = dict(manifest.get("features", {}))
+    with_kernel["features"]["numbaScoring"] = True
+    kernel = agent.recommend(with_kernel, list(interests), top)
+
+    assert [s["title"] for s in kernel["sessions"]] == [
+        s["title"] for s in base["sessions"]
+    ]
+    for k, b in zip(kernel["scoring"], base["scoring"]):
+        assert k["score"] == pytest.approx(b["score"], abs=1e-4)
@@ -0,0 +1,102 @@
+"""Serve-path behaviors: raw markdown export, ETag revalidation, chunked transfer."""
+
+import subprocess, sys, time, urllib.error, urllib.request, json, pathlib, socket
+
+AGENT = pathlib.Path(__file__).resolve().parents[1] / "agent.py"
+PORT = 8094  # distinct from test_server.py so the suites don't collide
+
+
+def wait_port(port, timeout=5.0):
+    start = time.time()
+    while time.time() - start < timeout:
+        with socket.socket() as s:
+            try:
+                s.connect(("127.0.0.1", port))
+                return True
+            except OSError:
+                time.sleep(0.1)
+    return False
+
+
+def _serve(cwd):
+    # cwd is a temp dir so telemetry.jsonl / exports / the external
+    # sessions file all stay out of the repo tree
+    return subprocess.Popen(
+        [sys.executable, str(AGENT), "serve", "--port", str(PORT)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=str(cwd),
+    )
+
+
+def _stop(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=3)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def test_export_format_md_returns_raw_markdown(tmp_path):
+    proc = _serve(tmp_path)
+    try:
+        assert wait_port(PORT), "server did not start"
+        url = f"http://127.0.0.1:{PORT}/export?interests=agents,ai+safety&format=md"
+        with urllib.request.urlopen(url) as r:
+            body = r.read().decode()
+            assert r.headers.get("Content-Type", "").startswith("text/markdown")
+            assert r.headers.get("Content-Length") == str(len(body.encode()))
+        assert body.startswith("# Event Itinerary")
+    finally:
+        _stop(proc)
+
+
+def test_recommend_etag_revalidation_returns_304(tmp_path):
+    proc = _serve(tmp_path)
+    try:
+        assert wait_port(PORT), "server did not start"
+        url = f"http://127.0.0.1:{PORT}/recommend?interests=agents,ai+safety&top=3"
+        with urllib.request.urlopen(url) as r:
+            etag = r.headers.get("ETag")
+            json.loads(r.read().decode())
+        assert etag and etag.startswith('"') and etag.endswith('"')
+        req = urllib.request.Request(url, headers={"If-None-Match": etag})
+        try:
+            with urllib.request.urlopen(req) as r:
+                raise AssertionError(f"expected 304, got {r.status}")
+        except urllib.error.HTTPError as e:
+            assert e.code == 304
+            assert e.headers.get("ETag") == etag
+            assert e.read() == b""
+    finally:
+        _stop(proc)
+
+
+def test_large_response_uses_chunked_transfer(tmp_path):
+    # The bundled manifest's five sessions can't exceed the 64 KiB chunking
+    # threshold, so feed the server a big external session list instead
+    filler = "x" * 1024
+    sessions = [
+        {
+            "title": f"Session {i}",
+            "tags": ["agents"],
+            "popularity": 0.5,
+            "start": "2026-01-01T09:00:00",
+            "end": "2026-01-01T10:00:00",
+            "location": f"Room {i}",
+            "description": filler,
+        }
+        for i in range(120)
+    ]
+    (tmp_path / "sessions_external.json").write_text(json.dumps(sessions))
+    proc = _serve(tmp_path)
+    try:
+        assert wait_port(PORT), "server did not start"
+        url = f"http://127.0.0.1:{PORT}/recommend?interests=agents&top=120"
+        with urllib.request.urlopen(url) as r:
+            assert r.headers.get("Transfer-Encoding") == "chunked"
+            assert r.headers.get("Content-Length") is None
+            data = json.loads(r.read().decode())
+        assert len(data["sessions"]) == 120
+    finally:
+        _stop(proc)